@@ -2,18 +2,19 @@ import cmd
 import os
 import sys
 import argparse
-import datetime
-import readline
+import atexit
+import functools
+import time
 import bc125py
 from bc125py.app import core, log
-from bc125py import sdo, mappings, con as _c
+from bc125py import con as _c
 
 
-# Manual port override to be used by cli commands
-_port: str = None
+# Shell history file, resolved once
+_HISTORY_PATH: str = os.path.expanduser("~/.bc125py_history")
 
-# Port finding method
-_port_detect_legacy = False
+# Port found (or selected) by the last successful get_scanner_connection(), reused for the rest of the run
+_cached_port: str = None
 
 
 # --- CLI Utility functions
@@ -28,17 +29,32 @@ def enforce_root() -> None:
 
 
 # CLI Get Scanner Connection w/ port prompt
-def get_scanner_connection(port: str = None) -> _c.ScannerConnection:
+def get_scanner_connection(port: str = None, legacy_detect: bool = False, use_daemon: bool = True,
+						   pipelining: bool = False) -> _c.ScannerConnection:
 	log.debug(
 		"cli get_scanner_connection",
 		"provided port:", port,
-		"legacy mode:", _port_detect_legacy
+		"legacy mode:", legacy_detect,
+		"pipelining:", pipelining
 	)
 
+	# If a daemon is running, use its connection
+	if not port and use_daemon:
+		daemon_con = core.get_daemon_connection()
+		if daemon_con:
+			log.debug("cli get_scanner_connection: using daemon")
+			return daemon_con
+
+	# Reuse the port we already found, rather than scanning (and maybe asking the user) again
+	global _cached_port
+	if not port and _cached_port:
+		log.debug("cli get_scanner_connection: using cached port:", _cached_port)
+		port = _cached_port
+
 	# If we have not a user provided port, we must find one
 	if not port:
 		# Get all ports
-		found_ports: list = _c.ScannerConnection.find_ports(_port_detect_legacy)
+		found_ports: list = _c.ScannerConnection.find_ports(legacy_detect)
 
 		# Error and exit if none found
 		if not found_ports:
@@ -73,13 +89,122 @@ def get_scanner_connection(port: str = None) -> _c.ScannerConnection:
 			port = found_ports[0]
 		
 	# Now, get scanner connection
-	return core.get_scanner_connection(port)
+	# A port that failed to connect may be gone, so don't reuse it
+	try:
+		con = core.get_scanner_connection(port, pipelining)
+	except ConnectionError:
+		_cached_port = None
+		raise
 
+	_cached_port = port
 
-# --- Program entrypoint
-def main() -> int:
+	return con
+
+
+# --- Command Line Arguments ---
+# Subcommands, and their help text, in help order
+_SUBC_HELP: dict = {
+	"test": "test scanner connection",
+	"unlock": "unlock the scanner from program mode",
+	"import": "read data from scanner, output to file",
+	"export": "write data from file to scanner",
+	"validate": "validate a scanner save file",
+	"shell": "launch interactive scanner shell",
+	"wipe": "factory reset scanner",
+	"daemon": "keep the scanner connection open for other " + bc125py.PACKAGE_NAME + " commands to use"
+}
+
+# Universal options which take a value, so that value isn't mistaken for the subcommand
+_OPTIONS_WITH_VALUE: tuple = ("-l", "--log", "-p", "--port")
+
+
+def _add_import_arguments(import_parser: argparse.ArgumentParser) -> None:
+	import_parser.add_argument("file", help="output file")
+	import_parser.add_argument(
+		"-c",
+		"--csv",
+		action="store_true",
+		help="import channels ONLY, and write as CSV"
+	)
+	import_parser.add_argument(
+		"--pipeline",
+		action="store_true",
+		help="send channels in batches without waiting for each response. faster, but not tested on every firmware"
+	)
+
+
+def _add_export_arguments(export_parser: argparse.ArgumentParser) -> None:
+	export_parser.add_argument("file", help="input file")
+	export_parser.add_argument(
+		"-c",
+		"--csv",
+		action="store_true",
+		help="export and write channels CSV file"
+	)
+	export_parser.add_argument(
+		"--pipeline",
+		action="store_true",
+		help="send channels in batches without waiting for each response. faster, but not tested on every firmware"
+	)
+
+
+def _add_validate_arguments(validate_parser: argparse.ArgumentParser) -> None:
+	validate_parser.add_argument("file", help="input file")
+	validate_parser.add_argument(
+		"-c",
+		"--csv",
+		action="store_true",
+		help="verify channels CSV file"
+	)
+
+
+def _add_shell_arguments(shell_parser: argparse.ArgumentParser) -> None:
+	shell_parser.add_argument("file", help="commands file to execute", nargs="?", default=None)
+	shell_parser.add_argument(
+		"-c",
+		"--clear-history",
+		action="store_true",
+		help="clear the shell's history before start"
+	)
+
+
+# Subcommands with arguments of their own
+_SUBC_ARGUMENTS: dict = {
+	"import": _add_import_arguments,
+	"export": _add_export_arguments,
+	"validate": _add_validate_arguments,
+	"shell": _add_shell_arguments
+}
+
+
+def _find_subcommand(argv: list) -> str:
+	"""internal use. Find the subcommand in the command line, without a full parse
+
+	Args:
+		argv (list): command line arguments, without the program name
+
+	Returns:
+		str: the subcommand, or None if there isn't a known one (or help for the main parser was requested)
+	"""
+
+	skip_value: bool = False
 
-	# --- Command Line Arguments ---
+	for arg in argv:
+		if skip_value:
+			skip_value = False
+		elif arg in _OPTIONS_WITH_VALUE:
+			skip_value = True
+		elif arg in ("-h", "--help"):
+			return None
+		elif not arg.startswith("-"):
+			return arg if arg in _SUBC_HELP else None
+
+	return None
+
+
+# Built once and reused
+@functools.lru_cache(maxsize=1)
+def _build_parser(subcommand: str = None) -> argparse.ArgumentParser:
 	# Create main cli parser
 	main_parser = argparse.ArgumentParser(
 		prog=bc125py.PACKAGE_NAME,
@@ -125,109 +250,75 @@ def main() -> int:
 	)
 
 	# Add subcommands
+	# Only the requested one is built, unless it's unknown (then argparse needs them all, for help and errors)
 	sub_parsers = main_parser.add_subparsers(dest="command", required=True, help="command")
 
-	# Subcommand test
-	test_parser = sub_parsers.add_parser("test", help="test scanner connection")
-
-	# Subcommand unlock
-	test_parser = sub_parsers.add_parser("unlock", help="unlock the scanner from program mode")
-
-	# Subcommand import/read
-	import_parser = sub_parsers.add_parser("import", help="read data from scanner, output to file")
-	import_parser.add_argument("file", help="output file")
-	import_parser.add_argument(
-		"-c",
-		"--csv",
-		action="store_true",
-		help="import channels ONLY, and write as CSV"
-	)
-
-	# Subcommand export/write
-	export_parser = sub_parsers.add_parser("export", help="write data from file to scanner")
-	export_parser.add_argument("file", help="input file")
-	export_parser.add_argument(
-		"-c",
-		"--csv",
-		action="store_true",
-		help="export and write channels CSV file"
-	)
-
-	# Subcommand export/write
-	export_parser = sub_parsers.add_parser("validate", help="validate a scanner save file")
-	export_parser.add_argument("file", help="input file")
-	export_parser.add_argument(
-		"-c",
-		"--csv",
-		action="store_true",
-		help="verify channels CSV file"
-	)
+	for name in (subcommand,) if subcommand else _SUBC_HELP:
+		subc_parser = sub_parsers.add_parser(name, help=_SUBC_HELP[name])
+
+		add_arguments = _SUBC_ARGUMENTS.get(name)
+		if add_arguments:
+			add_arguments(subc_parser)
+
+	return main_parser
+
+
+# --- Subcommand dispatch
+# Maps each subcommand to a function taking the parsed cli arguments
+# Subcommands which connect to the scanner also get the port (-p) and detection mode (--legacy-detect)
+_SUBC_DISPATCH: dict = {
+	"test": lambda cli_args: test(cli_args.port, cli_args.legacy_detect),
+	"unlock": lambda cli_args: unlock(cli_args.port, cli_args.legacy_detect),
+	"import": lambda cli_args: import_read(cli_args.file, cli_args.csv, cli_args.port, cli_args.legacy_detect, cli_args.pipeline),
+	"export": lambda cli_args: export_write(
+		cli_args.file,
+		cli_args.csv,
+		port=cli_args.port,
+		legacy_detect=cli_args.legacy_detect,
+		pipelining=cli_args.pipeline
+	),
+	"validate": lambda cli_args: export_write(cli_args.file, cli_args.csv, verify_only=True),
+	"shell": lambda cli_args: shell(
+		cmd_file_path=cli_args.file,
+		clear_history=cli_args.clear_history,
+		port=cli_args.port,
+		legacy_detect=cli_args.legacy_detect
+	),
+	"wipe": lambda cli_args: wipe(cli_args.port, cli_args.legacy_detect),
+	"daemon": lambda cli_args: daemon(cli_args.port, cli_args.legacy_detect)
+}
 
-	# Subcommand shell
-	shell_parser = sub_parsers.add_parser("shell", help="launch interactive scanner shell")
-	shell_parser.add_argument("file", help="commands file to execute", nargs="?", default=None)
-	shell_parser.add_argument(
-		"-c",
-		"--clear-history",
-		action="store_true",
-		help="clear the shell's history before start"
-	)
 
-	# Subcommand wipe
-	wipe_parser = sub_parsers.add_parser("wipe", help="factory reset scanner")
+# --- Program entrypoint
+def main() -> int:
 
 	# Parse arguments
-	cli_args = main_parser.parse_args()
-
-	# --- END Command Line Arguments ---
+	cli_args = _build_parser(_find_subcommand(sys.argv[1:])).parse_args()
 	
 	# Set verbosity level
 	log._DEBUG = cli_args.verbose
 
 	# Set up logging
+	# Block buffered, rather than a write per line. Flushed when the program exits
 	if cli_args.log:
-		log._FILE = open(cli_args.log, "w")
-	log.debug(bc125py.PACKAGE_NAME, "version", bc125py.PACKAGE_VERSION + ", started on", datetime.datetime.now())
-	log.debug("sysinfo:", core.get_system_str())
+		log._FILE = open(cli_args.log, "w", buffering=65536)
+		atexit.register(log._FILE.close)
+	# Gathering system info takes a while, only do it if it will be logged
+	if log._DEBUG:
+		log.debug(bc125py.PACKAGE_NAME, "version", bc125py.PACKAGE_VERSION + ", started on", time.strftime("%Y-%m-%d %H:%M:%S"))
+		log.debug("sysinfo:", core.get_system_str())
 	if not core.is_linux():
 		log.warn("Your system is unsupported!")
 
-	# Set port, if specified
-	if cli_args.port:
-		global _port
-		_port = cli_args.port
-	
-	# Set port detection mode
-	if cli_args.legacy_detect:
-		global _port_detect_legacy
-		_port_detect_legacy = True
-
-	# Dispatch subcommand
-	cmd = cli_args.command
-	if cmd == "test":
-		return test()
-	elif cmd == "unlock":
-		return unlock()
-	elif cmd == "import":
-		return import_read(cli_args.file, cli_args.csv)
-	elif cmd == "export":
-		return export_write(cli_args.file, cli_args.csv)
-	elif cmd == "validate":
-		return export_write(cli_args.file, cli_args.csv, verify_only=True)
-	elif cmd == "shell":
-		return shell(cmd_file_path=cli_args.file, clear_history=cli_args.clear_history)
-	elif cmd == "wipe":
-		return wipe()
-
-	# If this part of the code was reached, something went wrong with argparse
-	log.error("ERRoneous subc:", cli_args.command)
-
-	return 1
+	# Dispatch subcommand. argparse (required=True, fixed choices) guarantees it's a known one
+	return _SUBC_DISPATCH[cli_args.command](cli_args)
 
 
 # Help/List Tones custom action
 class ListTonesAction(argparse.Action):
 	def __call__(self, parser, args, values, option_string=None):
+		from bc125py import mappings
+
 		ctcss_keys = list(mappings.CTCSS.keys())
 		dcs_keys = list(mappings.DCS.keys())
 		special_keys = list(mappings.SPECIAL_CTCSS_DCS_VALUES.keys())
@@ -259,14 +350,14 @@ class ListTonesAction(argparse.Action):
 
 
 # Test command
-def test() -> int:
+def test(port: str = None, legacy_detect: bool = False) -> int:
 	log.debug("subc: test")
 
 	enforce_root()
 
 	try:
 		# Connect, try to get device model
-		con = get_scanner_connection(_port)
+		con = get_scanner_connection(port, legacy_detect)
 		print("Scanner model:", con.exec("MDL", return_tuple=False), "(success)")
 		con.close()
 
@@ -278,14 +369,16 @@ def test() -> int:
 
 
 # Unlock command
-def unlock() -> int:
+def unlock(port: str = None, legacy_detect: bool = False) -> int:
 	log.debug("subc: unlock")
 
+	from bc125py import sdo
+
 	enforce_root()
 
 	try:
 		# Connect, try to get device model
-		con = get_scanner_connection(_port)
+		con = get_scanner_connection(port, legacy_detect)
 		sdo.ExitProgramMode().write_to(con)
 		print("Device taken out of program mode")
 		con.close()
@@ -297,8 +390,60 @@ def unlock() -> int:
 		return 1
 
 
+def _channel_csv_rows(channels: list):
+	"""internal use. Generate one CSV row per channel, in import/export column order
+
+	Args:
+		channels (list): sdo.Channel list
+
+	Yields:
+		tuple: CSV row
+	"""
+
+	debug: bool = log._DEBUG
+
+	for c in channels:
+		c_dict = c.to_dict()
+
+		if debug:
+			log.debug("csv cin", c_dict)
+
+		yield (
+			c_dict["index"],
+			c_dict["name"],
+			c_dict["frequency"],
+			c_dict["modulation"],
+			c_dict["ctcss"],
+			c_dict["delay"],
+			c_dict["locked_out"],
+			c_dict["priority"]
+		)
+
+
+def _load_json(fin) -> dict:
+	"""internal use. Parse a JSON save file, using orjson (much faster) if it is installed
+
+	Args:
+		fin (file): the open save file
+
+	Raises:
+		ValueError: if the file is not valid JSON
+
+	Returns:
+		dict: the parsed save file
+	"""
+
+	try:
+		import orjson
+	except ImportError:
+		import json
+		return json.load(fin)
+
+	return orjson.loads(fin.read())
+
+
 # Import/Read command
-def import_read(out_file: str, csv: bool) -> int:
+def import_read(out_file: str, csv: bool, port: str = None, legacy_detect: bool = False, pipelining: bool = False) -> int:
 	log.debug(
 		"subc: import",
 		"file:",
@@ -306,6 +451,8 @@ def import_read(out_file: str, csv: bool) -> int:
 		"csv:", csv
 	)
 
+	from bc125py import sdo
+
 	enforce_root()
 
 	try:
@@ -314,7 +461,7 @@ def import_read(out_file: str, csv: bool) -> int:
 			
 
 		# Connect to scanner
-		scanner_con = get_scanner_connection(_port)
+		scanner_con = get_scanner_connection(port, legacy_detect, pipelining=pipelining)
 
 		# Read from scanner
 		if not stdout_mode:
@@ -337,8 +484,9 @@ def import_read(out_file: str, csv: bool) -> int:
 			fout = sys.stdout
 		
 		# Else, open output file as usual
+		# A large buffer coalesces the many small CSV row writes, newline="" is what the csv module expects
 		else:
-			fout = open(out_file, "w")
+			fout = open(out_file, "w", buffering=1024 * 1024, newline="")
 
 		if not csv:
 
@@ -347,7 +495,8 @@ def import_read(out_file: str, csv: bool) -> int:
 
 			log.debug("full import: writing to json")
 
-			fout.write(json.dumps(scanner.to_dict(), indent="\t", sort_keys=False))
+			# Stream straight into the (buffered) file, rather than building the whole document first
+			json.dump(scanner.to_dict(), fout, indent="\t", sort_keys=False)
 
 		else:
 
@@ -363,26 +512,8 @@ def import_read(out_file: str, csv: bool) -> int:
 				["Index", "Name", "Frequency (MHz)", "Modulation", "CTCSS", "Delay (sec)", "Lockout", "Priority"]
 			)
 
-			# Loop through write channel info
-			c: sdo.Channel
-			for c in scanner.channels:
-				c_dict = c.to_dict()
-
-				log.debug("csv cin", c_dict)
-
-				csv_writer.writerow(
-					[
-						c_dict["index"],
-						c_dict["name"],
-						c_dict["frequency"],
-						c_dict["modulation"],
-						c_dict["ctcss"],
-						c_dict["delay"],
-						c_dict["locked_out"],
-						c_dict["priority"]
-					]
-				)
-			del c
+			# Write all channel info in one call
+			csv_writer.writerows(_channel_csv_rows(scanner.channels))
 
 			log.debug("wrote csv")
 		
@@ -400,7 +531,8 @@ def import_read(out_file: str, csv: bool) -> int:
 
 
 # Export/Write command
-def export_write(in_file: str, csv: bool, verify_only: bool = False) -> int:
+def export_write(in_file: str, csv: bool, verify_only: bool = False, port: str = None, legacy_detect: bool = False,
+				 pipelining: bool = False) -> int:
 	log.debug(
 		"subc: export" + (" with verify_only option" if verify_only else ""),
 		"file:",
@@ -408,6 +540,8 @@ def export_write(in_file: str, csv: bool, verify_only: bool = False) -> int:
 		"csv:", csv,
 	)
 
+	from bc125py import sdo
+
 	if not verify_only:
 		enforce_root()
 
@@ -423,25 +557,20 @@ def export_write(in_file: str, csv: bool, verify_only: bool = False) -> int:
 
 		# Else, open file to read as usual
 		else:
-			fin = open(in_file, "r")
+			fin = open(in_file, "r", buffering=1024 * 1024)
 
 		if not verify_only:
 			print("Writing to scanner...")
 
 		if not csv:
 			# Normal (JSON) export
-			import json
-
-			# Read file data
-			in_file_data = fin.read()
-
 			# Create scanner from file data
 			scanner: sdo.Scanner = sdo.Scanner()
 			log.debug("full export: parsing json")
 
 			try:
 				scanner.from_dict(
-					json.loads(in_file_data)
+					_load_json(fin)
 				)
 			except sdo.InputValidationError as e:
 				for line in str(e).splitlines():
@@ -453,7 +582,7 @@ def export_write(in_file: str, csv: bool, verify_only: bool = False) -> int:
 				return 0
 			
 			# Connect to scanner
-			scanner_con = get_scanner_connection(port=_port)
+			scanner_con = get_scanner_connection(port, legacy_detect, pipelining=pipelining)
 
 			# Write to scanner
 			log.debug("full export: writing to scanner")
@@ -470,38 +599,18 @@ def export_write(in_file: str, csv: bool, verify_only: bool = False) -> int:
 			# Skip header row
 			next(csv_reader)
 
-			# Create list of channels
-			channels: list = []
-
-			# Loop through each row
+			# Create (and validate) a channel from each row
 			log.debug("csv export: parsing csv")
-			for row in csv_reader:
-				# Create channel dict first
-				c_dict = {
-					"index": int(row[0]),
-					"name": row[1],
-					"frequency": row[2],
-					"modulation": row[3],
-					"ctcss": row[4],
-					"delay": int(row[5]),
-					"locked_out": row[6],
-					"priority": row[7]
-				}
-				log.debug("dict: " + str(c_dict))
-
-				# Create channel from dict
-				c: sdo.Channel = sdo.Channel()
+			try:
+				channels: list = [sdo.Channel.from_csv_row(row) for row in csv_reader]
+			except sdo.InputValidationError as e:
+				log.error(str(e))
+				return 1
 
-				try:
-					c.from_dict(c_dict)
+			if log._DEBUG:
+				for c in channels:
 					log.debug("cin: " + str(c))
-				except sdo.InputValidationError as e:
-					log.error(str(e))
-					return 1
 
-				# Append channel, once validated
-				channels.append(c)
-			
 			if verify_only:
 				print("file OK")
 				return 0
@@ -510,18 +619,29 @@ def export_write(in_file: str, csv: bool, verify_only: bool = False) -> int:
 			log.debug("csv export: write channels")
 
 			# Connect to scanner
-			scanner_con = get_scanner_connection(port=_port)
+			scanner_con = get_scanner_connection(port, legacy_detect, pipelining=pipelining)
+
+			# Build every write command up front, then send them as one batch
+			write_commands: list = [c.to_write_command() for c in channels]
+
+			if log._DEBUG:
+				for command in write_commands:
+					log.debug("WRITING CHANNEL", ",".join(map(str, command)))
 
 			# PRG
 			sdo.EnterProgramMode().write_to(scanner_con)
 
-			c: sdo.Channel
-
-			for c in channels:
-				log.debug("WRITING CHANNEL", ",".join(map(lambda n : str(n), c.to_write_command())))
-				c.write_to(scanner_con)
+			try:
+				scanner_con.exec_many(write_commands)
 
-			del c
+			# EPG, even if a write failed, so the scanner isn't left in program mode.
+			# If the connection died (or the scanner is confused), EPG fails too. Report the original error, not that one
+			except Exception:
+				try:
+					sdo.ExitProgramMode().write_to(scanner_con)
+				except (ConnectionError, _c.CommandError) as e:
+					log.error("Could not exit program mode: " + str(e))
+				raise
 
 			# EPG
 			sdo.ExitProgramMode().write_to(scanner_con)
@@ -542,26 +662,42 @@ def export_write(in_file: str, csv: bool, verify_only: bool = False) -> int:
 
 
 class Shell(cmd.Cmd):
-	HISTORY_FILE_PATH = os.path.expanduser('~/.bc125py_history')
+	HISTORY_FILE_PATH = _HISTORY_PATH
 
-	def __init__(self, con):
+	def __init__(self, con, use_history: bool = True):
 		super(Shell, self).__init__()
 		self.intro = (bc125py.PACKAGE_NAME + " " + bc125py.PACKAGE_VERSION +
 					  " scanner shell" + os.linesep +
 					  "try commands \"help\" or \"exit\"" + os.linesep)
 		self.prompt = "> "
 		self.__con = con
+		# Bound once, default() runs it for every scanner command
+		self.__exec = con.exec
 		self.__shell_echo = True
 		self.__shell_allow_error = True
 		self.__shell_history_file = self.HISTORY_FILE_PATH
 		self.__shell_history_size = 1000
+		self.__shell_use_history = use_history
 
 	def preloop(self):
+		if not self.__shell_use_history:
+			return
+
+		import readline
+
+		# Cap the history before loading it, so a long history file isn't kept whole.
+		# The cap also truncates the file when it's written back
+		readline.set_history_length(self.__shell_history_size)
+
 		if os.path.exists(self.__shell_history_file):
 			readline.read_history_file(self.__shell_history_file)
 
 	def postloop(self):
-		readline.set_history_length(self.__shell_history_size)
+		if not self.__shell_use_history:
+			return
+
+		import readline
+
 		readline.write_history_file(self.__shell_history_file)
 
 	def help_echo(self):
@@ -608,37 +744,36 @@ class Shell(cmd.Cmd):
 	def default(self, arg):
 		if arg[:1] == "#":
 			return False
-		print(self.__con.exec(arg, echo=self.__shell_echo, return_tuple=False,
+		print(self.__exec(arg, echo=self.__shell_echo, return_tuple=False,
 							  allow_error=self.__shell_allow_error))
 
 # Shell command
-def shell(cmd_file_path: str = None, clear_history: bool = False) -> int:
+def shell(cmd_file_path: str = None, clear_history: bool = False, port: str = None, legacy_detect: bool = False) -> int:
 	log.debug("subc: shell")
 
 	enforce_root()
 
 	# Clear history if the user requested it. Fail silently
 	if clear_history:
-		log.debug("subc: shell: Clearing shell history file: " + Shell.HISTORY_FILE_PATH)
+		log.debug("subc: shell: Clearing shell history file: " + _HISTORY_PATH)
 		try:
-			os.unlink(Shell.HISTORY_FILE_PATH)
+			os.unlink(_HISTORY_PATH)
 			log.debug("subc: shell: Shell history file successfully cleared")
 		except Exception as e:
 			log.debug("subc: shell: error deleting history file: " + str(e))
 
 	try:
 		# Connect
-		con = get_scanner_connection(_port)
+		con = get_scanner_connection(port, legacy_detect)
 
-		the_shell = Shell(con)
+		# Command files don't need (or add to) the interactive history
+		the_shell = Shell(con, use_history=not cmd_file_path)
+		fin = None
 
 		# If we're reading from a command file
 		if cmd_file_path:
 			log.debug("subc: shell: commands file:", cmd_file_path)
 
-			# Open file and read
-			fin = None
-
 			# If the filename is -, read from stdin
 			if cmd_file_path == "-":
 				fin = sys.stdin
@@ -648,14 +783,18 @@ def shell(cmd_file_path: str = None, clear_history: bool = False) -> int:
 			else:
 				fin = open(cmd_file_path, "r")
 
-			# Skip the intro and exit when done
+			# Run commands line by line as they are read, skip the intro and prompt.
+			# The shell exits at the end of the file
+			the_shell.stdin = fin
+			the_shell.use_rawinput = False
 			the_shell.intro = ""
-			the_shell.cmdqueue.extend(fin.read().splitlines() + ["exit"])
+			the_shell.prompt = ""
 
+		the_shell.cmdloop()
+
+		if fin:
 			fin.close()
 
-		the_shell.cmdloop()
-			
 		# Close scanner connection
 		con.close()
 
@@ -667,9 +806,11 @@ def shell(cmd_file_path: str = None, clear_history: bool = False) -> int:
 
 
 # Wipe command
-def wipe():
+def wipe(port: str = None, legacy_detect: bool = False) -> int:
 	log.debug("subc: wipe")
 
+	from bc125py import sdo
+
 	# User confirmation password
 	USER_CONFIRMATION_PASSWORD = "I understand the consequences."
 
@@ -696,7 +837,7 @@ def wipe():
 	try:
 
 		# Connect
-		con = get_scanner_connection(_port)
+		con = get_scanner_connection(port, legacy_detect)
 
 		# Issue wipe command
 		print("Wiping scanner. DO NOT UNPLUG THE DEVICE OR TURN POWER OFF!")
@@ -713,3 +854,90 @@ def wipe():
 	except Exception as e:
 		log.error(str(e))
 		return 1
+
+
+# Daemon command
+def daemon(port: str = None, legacy_detect: bool = False) -> int:
+	log.debug("subc: daemon")
+
+	enforce_root()
+
+	import socketserver
+
+	socket_path: str = core.get_daemon_socket_path()
+
+	# Make sure we aren't already running. Clean up after a daemon that didn't exit cleanly
+	if os.path.exists(socket_path):
+		running_daemon = core.get_daemon_connection()
+		if running_daemon:
+			running_daemon.close()
+			log.error("A daemon is already running at", socket_path)
+			return 1
+
+		log.debug("daemon: removing stale socket", socket_path)
+		try:
+			os.unlink(socket_path)
+		except OSError as e:
+			log.error("Could not remove stale socket:", str(e))
+			return 1
+
+	try:
+		# Connect to the scanner itself, never to another daemon
+		con = get_scanner_connection(port, legacy_detect, use_daemon=False)
+	except ConnectionError as e:
+		log.error(str(e))
+		return 1
+
+	# Answer one command per line with the raw scanner response.
+	# Each client gets its own thread, so an idle client doesn't block the others.
+	# The connection's exec lock keeps each command and its response together
+	class DaemonRequestHandler(socketserver.StreamRequestHandler):
+		def handle(self):
+			# Dropping the client tells it something went wrong
+			try:
+				for line in self.rfile:
+					try:
+						command = line.rstrip(b"\r\n").decode("ascii")
+					except UnicodeDecodeError:
+						log.debug("daemon: dropping client, command is not ASCII")
+						return
+
+					try:
+						resp = con.exec(command, echo=True, return_tuple=False, allow_error=True)
+					except ConnectionError as e:
+						log.error(str(e))
+						return
+
+					self.wfile.write(resp.encode("ascii") + b"\n")
+
+			# The client went away (e.g. broken pipe). That's its business, not the scanner's
+			except OSError as e:
+				log.debug("daemon: client disconnected: " + str(e))
+
+	# Don't wait for connected clients when stopping
+	class DaemonServer(socketserver.ThreadingUnixStreamServer):
+		daemon_threads = True
+
+	try:
+		server = DaemonServer(socket_path, DaemonRequestHandler)
+	except OSError as e:
+		log.error("Could not create socket " + socket_path + ":", str(e))
+		con.close()
+		return 1
+
+	try:
+		# Only we may use the scanner
+		os.chmod(socket_path, 0o600)
+
+		print("Daemon listening at", socket_path, "(Ctrl+C to stop)")
+		server.serve_forever()
+
+	except KeyboardInterrupt:
+		print("done")
+
+	finally:
+		server.server_close()
+		os.unlink(socket_path)
+		con.close()
+
+	return 0
@@ -2,13 +2,41 @@ import platform
 import sys
 import os
 import shutil
+import functools
 import subprocess
 from bc125py.con import *
 from bc125py.app import log
 
 
+# The optional distro package, or None if it isn't installed. See _import_distro()
+_distro = None
+_distro_import_attempted: bool = False
+
+
+def _import_distro():
+	"""internal use. Import the optional distro package, only trying once.
+	A failed import searches the whole path again every time, so remember the result
+
+	Returns:
+		module: The distro module, or None if it is not installed
+	"""
+
+	global _distro, _distro_import_attempted
+
+	if not _distro_import_attempted:
+		_distro_import_attempted = True
+
+		try:
+			import distro as _distro
+		except ImportError:
+			_distro = None
+
+	return _distro
+
+
+@functools.lru_cache(maxsize=1)
 def get_system_str() -> str:
-	"""Get a summary string of the local machine
+	"""Get a summary string of the local machine. Computed once per run
 
 	Returns:
 		str: Machine information
@@ -17,12 +45,12 @@ def get_system_str() -> str:
 	os_info: str
 
 	# Try to get a nice string representing the linux distro
-	try:
-		import distro
+	distro = _import_distro()
+	if distro:
 		os_info = distro.name(pretty=True)
 
 	# Otherwise, use a more generic string
-	except ImportError:
+	else:
 		os_info = platform.system() + " " + platform.release()
 
 	# Get CPU architecture
@@ -56,9 +84,11 @@ def is_root() -> bool:
 	return os.getuid() == 0
 
 
+@functools.lru_cache(maxsize=1)
 def detect_tlp() -> bool:
 	"""Determines if TLP is active. TLP can interfere with scanner communication.
 	THIS MAY NOT BE 100% ACCURATE!!!
+	Only checked (and warned about) once per run.
 
 	Returns:
 		bool: True if tlp detected & enabled.
@@ -68,22 +98,57 @@ def detect_tlp() -> bool:
 		log.debug("core: detected TLP")
 
 		try:
-			# See if TLP is actually enabled, warn if true
-			if "TLP_ENABLE=\"1\"" in subprocess.check_output([tlp_bin, "-c"], stderr=subprocess.DEVNULL).decode():
+			# See if TLP is actually enabled, warn if true. Search the raw output, no need to decode it
+			if b"TLP_ENABLE=\"1\"" in subprocess.check_output([tlp_bin, "-c"], stderr=subprocess.DEVNULL):
 				log.warn("TLP is enabled. This may block scanner connection")
 
 				return True
 		except Exception as e:
-			log.debug("core: could not determine if TLP is active: " + e)
+			log.debug("core: could not determine if TLP is active: " + str(e))
 	
 	return False
 
 
-def get_scanner_connection(port: str = None) -> ScannerConnection:
+def get_daemon_socket_path() -> str:
+	"""Get the path of the socket "bc125py daemon" listens on
+
+	Returns:
+		str: The socket path
+	"""
+
+	return os.path.join(os.environ.get("XDG_RUNTIME_DIR", "/run"), "bc125py.sock")
+
+
+def get_daemon_connection() -> DaemonScannerConnection:
+	"""Connect to a running "bc125py daemon", if there is one
+
+	Returns:
+		bc125py.con.DaemonScannerConnection: The active connection, or None if no daemon is running
+	"""
+
+	socket_path: str = get_daemon_socket_path()
+
+	# Only trust a socket created by this user
+	try:
+		if os.stat(socket_path).st_uid != os.getuid():
+			log.debug("core: ignoring daemon socket owned by another user:", socket_path)
+			return None
+	except OSError:
+		return None
+
+	try:
+		return DaemonScannerConnection(socket_path)
+	except ConnectionError as e:
+		log.debug("core: daemon not reachable: " + str(e))
+		return None
+
+
+def get_scanner_connection(port: str = None, pipelining: bool = False) -> ScannerConnection:
 	"""Find and connect to the scanner
 
 	Args:
 		port (str, optional): The port to connect to
+		pipelining (bool, optional): Should batches of commands be pipelined? See ScannerConnection.exec_many(). Defaults to False.
 		simulate (bool, optional): Whether this should create a simulated connection.
 
 	Raises:
@@ -100,7 +165,7 @@ def get_scanner_connection(port: str = None) -> ScannerConnection:
 	detect_tlp()
 
 	con: ScannerConnection
-	con = ScannerConnection()
+	con = ScannerConnection(pipelining=pipelining)
 	con.connect(port)
 
 	return con
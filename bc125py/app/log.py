@@ -5,13 +5,14 @@ _DEBUG: bool = False
 _FILE = sys.stdout
 
 
-def __split_print(*args, console_out_file = sys.stdout) -> None:
-	"""Print message to stdout and logfile, if applicable
+def __split_print(*args, console_out_file = sys.stdout, flush: bool = False) -> None:
+	"""Print message to stdout and logfile, if applicable.
+	The logfile is block buffered; flush it right away for messages that must not be lost
 	"""
 
 	print(*args, file=console_out_file)
 	if _FILE != sys.stdout:
-		print(*args, file=_FILE)
+		print(*args, file=_FILE, flush=flush)
 
 
 def debug(*args) -> None:
@@ -26,11 +27,11 @@ def warn(*args) -> None:
 	"""Log warning
 	"""
 
-	__split_print("[WARN]", *args, console_out_file=sys.stderr)
+	__split_print("[WARN]", *args, console_out_file=sys.stderr, flush=True)
 
 
 def error(*args) -> None:
 	"""Log error
 	"""
 
-	__split_print("[ERROR]", *args, console_out_file=sys.stderr)
+	__split_print("[ERROR]", *args, console_out_file=sys.stderr, flush=True)
@@ -1,11 +1,159 @@
 import os
 import glob
 import time
+import functools
+import threading
 from bc125py.app import log
-try:
-	import serial
-except ImportError:
-	log.error("pySerial not found (import serial failed)")
+
+
+# pySerial. Imported on first connection, see _import_serial()
+serial = None
+
+
+def _import_serial() -> None:
+	"""internal use. Import pySerial, if not already imported.
+	Deferred so commands that never touch the scanner don't pay for it.
+
+	Raises:
+		ConnectionError: if pySerial is not installed
+	"""
+
+	global serial
+
+	if serial is None:
+		try:
+			import serial
+		except ImportError:
+			log.error("pySerial not found (import serial failed)")
+			raise ConnectionError("pySerial not found (import serial failed)")
+
+
+# pySerial's port lister. Imported on first use, see _get_comports()
+_comports = None
+
+
+def _get_comports():
+	"""internal use. Get pySerial's comports() function, importing it on first use.
+
+	Raises:
+		ImportError: if pySerial is not installed
+
+	Returns:
+		function: serial.tools.list_ports.comports
+	"""
+
+	global _comports
+
+	if _comports is None:
+		from serial.tools.list_ports import comports as _comports
+
+	return _comports
+
+
+# Set once the driver string has been injected (or wasn't needed). The binding lasts until reboot
+_driver_bound: bool = False
+
+# Device files that only exist once the scanner is bound to a driver
+_SCANNER_DEVICE_PATTERNS: tuple = (
+	"/dev/serial/by-id/*BC125AT*",
+	"/dev/serial/by-id/*BC126AT*" # international version
+)
+
+# How long (in seconds) to wait for the device file after setting up the driver
+_DEVICE_FILE_WAIT: float = 0.5
+
+# How long (in seconds) to wait for a response. Some commands (like CLR) take a long time
+_READ_TIMEOUT: float = 120
+
+# How long (in seconds) a write may block before the scanner is considered unresponsive
+_WRITE_TIMEOUT: float = 5.0
+
+# The 125AT's line ending, for both commands and responses
+_LINE_ENDING: bytes = b"\r"
+
+# The longest response (in bytes) we will buffer while waiting for a line ending
+_MAX_RESPONSE_SIZE: int = 4096
+
+# Responses ending in these mean the command failed
+_ERROR_RESPONSE_SUFFIXES: tuple = (b"ERR", b"NG")
+
+# How many commands a pipelined exec_many() sends before reading their responses.
+# Keeps the scanner's input buffer from overflowing on long batches
+_PIPELINE_WINDOW: int = 16
+
+# How long (in seconds) a pipelined exec_many() waits for a response before deciding the scanner can't keep up.
+# Much shorter than _READ_TIMEOUT, the commands it's used for answer right away
+_PIPELINE_READ_TIMEOUT: float = 2.0
+
+# How many read-only query responses a connection keeps
+_RESPONSE_CACHE_SIZE: int = 128
+
+# How long (in seconds) found ports are reused for before searching again
+_PORT_CACHE_TTL: float = 5.0
+
+# Directories whose entries change when a device is plugged in or removed
+_DEVICE_DIRS: tuple = ("/dev", "/dev/serial/by-id")
+
+# Ports found by the last ScannerConnection.find_ports() call
+_port_cache: dict = {"time": 0.0, "legacy": False, "ports": [], "dirs": None}
+
+
+def _clear_port_cache() -> None:
+	"""internal use. Forget previously found ports
+	"""
+
+	_port_cache["time"] = 0.0
+	_port_cache["ports"] = []
+	_port_cache["dirs"] = None
+
+
+def _device_dirs_mtime():
+	"""internal use. Get the modification times of the device directories.
+	Unchanged times mean no device was added or removed
+
+	Returns:
+		tuple: One mtime per device directory (None if missing), or None if /dev can't be checked
+	"""
+
+	mtimes = []
+	for path in _DEVICE_DIRS:
+		try:
+			mtimes.append(os.stat(path).st_mtime_ns)
+		except OSError:
+			mtimes.append(None)
+
+	if mtimes[0] is None:
+		return None
+
+	return tuple(mtimes)
+
+
+def _to_command_str(command) -> str:
+	"""internal use. Convert a command in string or tuple form to a command string
+
+	Args:
+		command (tuple, list, str): The command, as a string or an iterable of its fields
+
+	Raises:
+		TypeError: if the command is neither str nor an iterable of fields
+
+	Returns:
+		str: The command string
+	"""
+
+	# Most commands are sent as strings already
+	if command.__class__ is str:
+		return command
+
+	# Iterating bytes would yield ints, not fields
+	if isinstance(command, (bytes, bytearray)):
+		raise TypeError("exec() command must be str or iterable of fields")
+
+	try:
+		# Only convert elements that aren't strings already
+		return ",".join([c if c.__class__ is str else str(c) for c in command])
+	except TypeError:
+		raise TypeError("exec() command must be str or iterable of fields") from None
 
 
 class CommandError(RuntimeError):
@@ -15,6 +163,8 @@ class CommandError(RuntimeError):
 		RuntimeError (str): Error message
 	"""
 
+	__slots__ = ()
+
 	def __init__(self, message: str = "A command error has occurred"):
 		super().__init__(message)
 
@@ -23,12 +173,38 @@ class ScannerConnection:
 	"""A connection to the scanner
 	"""
 
-	connected: bool = False
-	__serial: serial.Serial = None
+	# Fixed attribute set, no per-instance __dict__
+	__slots__ = (
+		"connected",
+		"pipelining",
+		"_exec_lock",
+		"__serial",
+		"__rx_buffer",
+		"__response_cache",
+	)
 
 
-	def __init__(self):
-		pass
+	def __init__(self, pipelining: bool = False):
+		"""Constructor
+
+		Args:
+			pipelining (bool, optional): Should exec_many() send commands before reading earlier responses? See exec_many(). Defaults to False.
+		"""
+
+		self.connected: bool = False
+		self.__serial = None # serial.Serial
+		self.__rx_buffer: bytearray = None
+
+		# Only one command may be in flight at a time, across threads. Held by exec() and exec_many().
+		# Reentrant, exec_many() may fall back to exec()
+		self._exec_lock = threading.RLock()
+
+		# Responses to read-only queries, see exec()
+		self.__response_cache = {}
+
+		# Send all of exec_many()'s commands before reading any response?
+		# Not verified on every firmware, so it is opt-in
+		self.pipelining: bool = pipelining
 
 
 	def connect(self, port: str = None) -> None:
@@ -59,7 +235,12 @@ class ScannerConnection:
 		log.debug("con: using port: " + port)
 
 		# Third, establish a device connection.
-		self.__open_connection(port)
+		# If a found port doesn't work, make sure it isn't handed out again
+		try:
+			self.__open_connection(port)
+		except ConnectionError:
+			_clear_port_cache()
+			raise
 
 		self.connected = True
 		log.debug("con: connection successfully established")
@@ -75,18 +256,90 @@ class ScannerConnection:
 			ConnectionError: if connection fails
 		"""
 
+		_import_serial()
+
 		# Now, try to open the device file
+		# The timeouts are passed here so the port isn't reconfigured right after opening
 		try:
-			self.__serial = serial.Serial(port)
-			self.__serial.timeout = 120
+			self.__serial = serial.Serial(port, timeout=_READ_TIMEOUT, write_timeout=_WRITE_TIMEOUT)
+
+			# Throw away anything left over from an earlier session, so it isn't taken as the first response
 			self.__serial.reset_input_buffer()
-			self.__serial.reset_output_buffer()
 
 		except serial.SerialException as e:
 			raise ConnectionError("Error connecting to scanner: " + str(e))
 
+		# Holds bytes read from the scanner that haven't been returned yet
+		self.__rx_buffer = bytearray()
+
+
+	def __read_line(self, timeout_ok: bool = False) -> bytes:
+		"""internal use. Read one line (up to the 125AT's \\r line ending) from the scanner.
+		Reads everything already waiting on the port at once instead of going byte by byte.
+		Any bytes past the line ending are kept for the next call.
+
+		Args:
+			timeout_ok (bool, optional): On timeout, return None and keep any partial line, instead of raising. Defaults to False.
+
+		Raises:
+			ConnectionError: if the scanner doesn't answer before the timeout
+			ConnectionError: if the scanner sends more than _MAX_RESPONSE_SIZE bytes without a line ending
 
-	def _exec(self, command: str) -> str:
+		Returns:
+			bytes: the line, without the line ending. None if timeout_ok and the scanner didn't answer in time
+		"""
+
+		# Looked up once, not on every pass through the loop
+		buf: bytearray = self.__rx_buffer
+		find = buf.find
+		port = self.__serial
+		read = port.read
+
+		while True:
+			# Return the line as soon as we have a line ending
+			end: int = find(_LINE_ENDING)
+			if end >= 0:
+				# Copy the line out of the buffer once, then drop it from the buffer in place
+				with memoryview(buf) as view:
+					line: bytes = view[:end].tobytes()
+				del buf[:end + 1]
+				return line
+
+			# No response is anywhere near this long. Don't keep buffering garbage
+			if len(buf) > _MAX_RESPONSE_SIZE:
+				self.__recover()
+				raise ConnectionError("Invalid response from scanner (no line ending)")
+
+			# Block for at least one byte, then grab whatever else has arrived
+			chunk: bytes = read(port.in_waiting or 1)
+
+			# Timed out, drop the partial line. Unless the caller will wait for the rest
+			if not chunk:
+				if timeout_ok:
+					return None
+				self.__recover()
+				raise ConnectionError("Timed out waiting for scanner response")
+
+			buf += chunk
+
+
+	def __recover(self) -> None:
+		"""internal use. After a failed read, throw away anything left over (in our buffer and the OS's),
+		so a late response isn't mistaken for the answer to the next command
+		"""
+
+		log.debug("con: discarding buffered data")
+
+		self.__rx_buffer.clear()
+
+		try:
+			self.__serial.reset_input_buffer()
+			self.__serial.reset_output_buffer()
+		except serial.SerialException as e:
+			log.debug("con: could not reset buffers: " + str(e))
+
+
+	def _exec(self, command: str) -> bytes:
 		"""INTERNAL USE! USE exec() INSTEAD! -- Execute a command
 
 		Args:
@@ -97,16 +350,20 @@ class ScannerConnection:
 			ConnectionError: if the response cannot be read
 
 		Returns:
-			str: device response
+			bytes: raw device response, without the line ending
 		"""
 
 		# First, try to send command to device
 		try:
-			# Don't forget to append a \r. It's the 125AT's line ending
-			send_data: bytes = bytes(command + "\r", "ascii")
-			# Send command
-			log.debug("con_exec: send:", send_data)
+			# Build bytes, not a bytearray, pySerial would copy a bytearray into bytes again
+			send_data: bytes = command.encode("ascii") + _LINE_ENDING
+
+			# Send command in a single write, make sure it's all out before reading
+			# Called for every command, so skip even the debug call unless it's needed
+			if log._DEBUG:
+				log.debug("con_exec: send:", send_data)
 			self.__serial.write(send_data)
+			self.__serial.flush()
 		except serial.SerialException as e:
 			raise ConnectionError("Could not communicate (write) with scanner: " + str(e))
 
@@ -115,16 +372,17 @@ class ScannerConnection:
 
 		# Read data from scanner
 		try:
-			resp = self.__serial.read_until(b"\r")
-			log.debug("con_exec: resp:", resp)
+			resp = self.__read_line()
+			if log._DEBUG:
+				log.debug("con_exec: resp:", resp)
 		except serial.SerialException as e:
 			raise ConnectionError("Could not communicate (read) with scanner: " + str(e))
 
-		# Decode and return response
-		return resp.decode("ascii").rstrip()
+		# Return raw response. exec() decodes it
+		return resp
 
 
-	def exec(self, command, echo: bool = False, return_tuple: bool = True, allow_error = False):
+	def exec(self, command, echo: bool = False, return_tuple: bool = True, allow_error = False, cacheable: bool = False):
 		"""Execute a command on the scanner. Get response.
 
 		Args:
@@ -132,6 +390,7 @@ class ScannerConnection:
 			echo (bool, optional): Should the response include the command name? Defaults to False.
 			return_tuple (bool, optional): Should the response be in tuple form? Defaults to True.
 			allow_error (bool, optional): Should we allow an invalid command? Defaults to False.
+			cacheable (bool, optional): Is this a read-only query whose response never changes? If so, it is only sent once per connection. Defaults to False.
 
 		Raises:
 			ConnectionError: if a connection was never established
@@ -146,22 +405,83 @@ class ScannerConnection:
 			raise ConnectionError("Cannot execute command when scanner isn't connected")
 
 		# Convert tuple command to command string
-		if type(command) is tuple:
-			command = ",".join(map(str, command))
-		elif type(command) is not str:
-			raise TypeError("exec() command must be str or tuple")
+		command = _to_command_str(command)
+
+		# A response must be read before another thread's command is sent
+		with self._exec_lock:
+			# Answer read-only queries from the cache, if we can
+			if cacheable and command in self.__response_cache:
+				if log._DEBUG:
+					log.debug("con_exec: cached:", command)
+				return ScannerConnection.__parse_response(
+					command, self.__response_cache[command], echo, return_tuple, allow_error
+				)
 
-		# Execute command, store result
-		resp = self._exec(command)
+			# Execute command, store result
+			resp = self._exec(command)
+			result = ScannerConnection.__parse_response(command, resp, echo, return_tuple, allow_error)
+
+			# Cache successful read-only queries. Anything else may change what is cached
+			if cacheable:
+				if len(self.__response_cache) >= _RESPONSE_CACHE_SIZE:
+					del self.__response_cache[next(iter(self.__response_cache))]
+				self.__response_cache[command] = resp
+			elif self.__response_cache:
+				self.__invalidate_cache(command)
+
+		return result
+
+
+	def __invalidate_cache(self, command: str) -> None:
+		"""internal use. Drop cached responses that the given command may have changed
+
+		Args:
+			command (str): a command that was just executed
+		"""
+
+		command_name: str = command.split(",", 1)[0]
+
+		# A memory wipe changes everything
+		if command_name == "CLR":
+			self.__response_cache.clear()
+			return
+
+		for cached_command in list(self.__response_cache):
+			if cached_command.split(",", 1)[0] == command_name:
+				del self.__response_cache[cached_command]
+
+
+	@staticmethod
+	def __parse_response(command: str, resp: bytes, echo: bool, return_tuple: bool, allow_error: bool):
+		"""internal use. Check and format a raw command response for exec().
+		Checks and trims the raw bytes, and only decodes what's left, once
+
+		Raises:
+			bc125py.CommandError: if the command produced an error and allow_error is False
+
+		Returns:
+			tuple, str: The command response in tuple or string form
+		"""
+
+		resp = resp.rstrip()
 
 		# Make sure command executed properly
 		if not allow_error:
-			if resp.endswith( ("ERR", "NG") ):
+			if resp.endswith(_ERROR_RESPONSE_SUFFIXES):
 				raise CommandError("Error in command: " + command)
 
-		# If echo is off (default), remove the command name from the response
+		# If echo is off (default), skip the command name (and its comma) in the response
+		start: int = 0
 		if not echo:
-			resp = resp[4:]
+			command_name_length: int = command.find(",")
+			if command_name_length < 0:
+				command_name_length = len(command)
+
+			start = command_name_length + 1
+
+		# Decode response straight from the buffer, without slicing a copy of it first
+		with memoryview(resp) as view:
+			resp = str(view[start:], "ascii")
 
 		# If we want the result as a tuple (default), create tuple
 		if return_tuple:
@@ -171,6 +491,175 @@ class ScannerConnection:
 		return resp
 
 
+	def _exec_many(self, commands: list) -> list:
+		"""INTERNAL USE! USE exec_many() INSTEAD! -- Send several commands at once, then read all responses.
+		If the responses are slow to arrive, pipelining is turned off, but every response is still waited for
+
+		Args:
+			commands (list): the commands to execute, as strings
+
+		Raises:
+			ConnectionError: if the commands fail to send
+			ConnectionError: if the responses cannot be read
+
+		Returns:
+			list: raw device responses (bytes), in command order
+		"""
+
+		# Put every command in one bytes object, so they go out in a single write (and pySerial doesn't copy it)
+		send_data: bytes = _LINE_ENDING.join([c.encode("ascii") for c in commands]) + _LINE_ENDING
+
+		try:
+			if log._DEBUG:
+				log.debug("con_exec_many: send:", send_data)
+			self.__serial.write(send_data)
+			self.__serial.flush()
+		except serial.SerialException as e:
+			raise ConnectionError("Could not communicate (write) with scanner: " + str(e))
+
+		# The scanner answers in order, one line per command
+		responses: list = []
+		try:
+			for _ in commands:
+				resp: bytes = self.__read_line(timeout_ok=self.pipelining)
+
+				# The scanner can't keep up. It may still be working through these commands,
+				# so wait for the rest of their responses (or they'd be taken as answers to later commands)
+				if resp is None:
+					log.debug("con: scanner is slow to answer pipelined commands, turning pipelining off")
+					self.pipelining = False
+					self.__set_read_timeout(_READ_TIMEOUT)
+					resp = self.__read_line()
+
+				responses.append(resp)
+		except serial.SerialException as e:
+			raise ConnectionError("Could not communicate (read) with scanner: " + str(e))
+
+		if log._DEBUG:
+			log.debug("con_exec_many: resp:", responses)
+
+		return responses
+
+
+	def __set_read_timeout(self, timeout: float) -> None:
+		"""internal use. Change how long reads wait for the scanner
+
+		Raises:
+			ConnectionError: if the port can't be reconfigured
+		"""
+
+		try:
+			self.__serial.timeout = timeout
+		except serial.SerialException as e:
+			raise ConnectionError("Could not configure scanner port: " + str(e))
+
+
+	def exec_many(self, commands: list, echo: bool = False, return_tuple: bool = True, allow_error = False,
+				  window: int = _PIPELINE_WINDOW) -> list:
+		"""Execute several commands on the scanner. Get all responses.
+		If pipelining is enabled, commands are sent in windows, each sent whole before its responses are read.
+		Otherwise, commands are executed one by one.
+		If the scanner is slow to answer a window, its responses are still waited for, then the remaining
+		commands are executed one by one. If it never answers, the batch fails; nothing is sent again.
+		Each window's responses are checked before the next window is sent, so a failed command stops the batch.
+		The commands after it in the same window have already been sent, though, and may have run.
+
+		Args:
+			commands (list): The commands to execute, each in string or tuple form
+			echo (bool, optional): Should the responses include the command name? Defaults to False.
+			return_tuple (bool, optional): Should the responses be in tuple form? Defaults to True.
+			allow_error (bool, optional): Should we allow an invalid command? Defaults to False.
+			window (int, optional): How many commands to send at once when pipelining. Defaults to _PIPELINE_WINDOW.
+
+		Raises:
+			ValueError: if window is < 1
+			ConnectionError: if a connection was never established
+			ConnectionError: if there is an error communicating with the scanner
+			bc125py.CommandError: if a command produces an error
+
+		Returns:
+			list: The command responses in tuple or string form, in command order
+		"""
+
+		if window < 1:
+			raise ValueError("exec_many() window must be >= 1, given " + str(window))
+
+		# The whole batch runs before any other thread's commands
+		with self._exec_lock:
+			# Only a serial connection (not a simulated or daemon one) can pipeline
+			if not self.pipelining or self.__serial is None:
+				return [self.exec(c, echo=echo, return_tuple=return_tuple, allow_error=allow_error) for c in commands]
+
+			if not self.connected:
+				raise ConnectionError("Cannot execute command when scanner isn't connected")
+
+			# Convert tuple commands to command strings
+			commands = [_to_command_str(c) for c in commands]
+
+			parse = ScannerConnection.__parse_response
+			results: list = []
+
+			# If the scanner doesn't keep up, find out quickly rather than after the full read timeout
+			self.__set_read_timeout(_PIPELINE_READ_TIMEOUT)
+			try:
+				for start in range(0, len(commands), window):
+					# The scanner was slow to answer. Don't pipeline on this connection any more
+					if not self.pipelining:
+						results += [parse(c, self._exec(c), echo, return_tuple, allow_error) for c in commands[start:]]
+						break
+
+					# Check this window for errors before sending the next one
+					window_commands: list = commands[start:start + window]
+					results += [
+						parse(c, r, echo, return_tuple, allow_error)
+						for c, r in zip(window_commands, self._exec_many(window_commands))
+					]
+			finally:
+				# Like exec(), drop cached responses these commands may have changed. Even if the batch stopped early
+				if self.__response_cache:
+					for command_name in {c.split(",", 1)[0] for c in commands}:
+						self.__invalidate_cache(command_name)
+
+				self.__set_read_timeout(_READ_TIMEOUT)
+
+		return results
+
+
+	async def exec_async(self, command, echo: bool = False, return_tuple: bool = True, allow_error = False, cacheable: bool = False):
+		"""Execute a command on the scanner without blocking the event loop. Get response.
+		The command runs in the event loop's default executor. Like exec(), it waits for any other thread's command to finish.
+
+		Args:
+			command (tuple, str): The command to execute, in string or tuple form
+			echo (bool, optional): Should the response include the command name? Defaults to False.
+			return_tuple (bool, optional): Should the response be in tuple form? Defaults to True.
+			allow_error (bool, optional): Should we allow an invalid command? Defaults to False.
+			cacheable (bool, optional): See exec(). Defaults to False.
+
+		Raises:
+			ConnectionError: if a connection was never established
+			ConnectionError: if there is an error communicating with the scanner
+			bc125py.CommandError: if the command produces an error
+
+		Returns:
+			tuple, str: The command response in tuple or string form
+		"""
+
+		import asyncio
+
+		return await asyncio.get_running_loop().run_in_executor(
+			None,
+			functools.partial(
+				self.exec,
+				command,
+				echo=echo,
+				return_tuple=return_tuple,
+				allow_error=allow_error,
+				cacheable=cacheable
+			)
+		)
+
+
 	def close(self) -> None:
 		"""Disconnect scanner. Safely closes connection.
 
@@ -181,6 +670,7 @@ class ScannerConnection:
 		if not self.connected:
 			raise ConnectionError("Can't close closed connection")
 		self.__serial.close()
+		self.__response_cache.clear()
 		self.connected = False
 		log.debug("con: connection closed")
 
@@ -205,6 +695,22 @@ class ScannerConnection:
 			list: list of potential device files
 		"""
 
+		# Reuse recently found ports, or older ones if no device was added or removed since. Searching is slow
+		dirs_mtime = _device_dirs_mtime()
+		if (
+			_port_cache["ports"]
+			and _port_cache["legacy"] == legacy_detection
+			and (
+				time.monotonic() - _port_cache["time"] < _PORT_CACHE_TTL
+				or (dirs_mtime is not None and dirs_mtime == _port_cache["dirs"])
+			)
+		):
+			log.debug("find_ports, cached -", _port_cache["ports"])
+			return list(_port_cache["ports"])
+
+		# Remember which detection mode was asked for, for the cache
+		requested_legacy_detection: bool = legacy_detection
+
 		# First, set up device driver. It doesn't matter if we do this multiple times
 		ScannerConnection.__setup_driver()
 
@@ -213,11 +719,8 @@ class ScannerConnection:
 
 		# Try to find scanner ports with pySerial
 		try:
-			# Import port finder function
-			from serial.tools.list_ports import comports
-
 			# Loop through comports. Add those with the 125AT's product id
-			for port in comports():
+			for port in _get_comports()():
 				if port.pid == 23: # BC125AT product id 0017 (hex) -> 23
 					found_ports.append(port.device)
 		except Exception as e:
@@ -227,8 +730,8 @@ class ScannerConnection:
 
 		# These are legacy patterns. Still useful if pySerial doesn't find any ports for some reason
 		if legacy_detection:
-			found_ports.extend(glob.glob("/dev/serial/by-id/*BC125AT*"))
-			found_ports.extend(glob.glob("/dev/serial/by-id/*BC126AT*")) # international version
+			for pattern in _SCANNER_DEVICE_PATTERNS:
+				found_ports.extend(glob.glob(pattern))
 			found_ports.extend(glob.glob("/dev/ttyACM*"))
 
 		log.debug(
@@ -236,6 +739,13 @@ class ScannerConnection:
 			"legacy-mode:", legacy_detection, "-",
 			found_ports
 		)
+
+		# Cache results
+		_port_cache["time"] = time.monotonic()
+		_port_cache["legacy"] = requested_legacy_detection
+		_port_cache["ports"] = list(found_ports)
+		_port_cache["dirs"] = dirs_mtime
+
 		return found_ports
 	
 
@@ -248,6 +758,19 @@ class ScannerConnection:
 			ConnectionError: if error writing to new_id file
 		"""
 
+		global _driver_bound
+
+		# Only needs to be done once
+		if _driver_bound:
+			return
+
+		# If the scanner's device file already exists, a driver is already bound
+		for pattern in _SCANNER_DEVICE_PATTERNS:
+			if glob.glob(pattern):
+				log.debug("con: scanner device file exists, skipping driver setup")
+				_driver_bound = True
+				return
+
 		try:
 			# Path to new acm device file
 			driver_path: str = "/sys/bus/usb/drivers/cdc_acm/new_id"
@@ -266,12 +789,17 @@ class ScannerConnection:
 			driver_file.close()
 			
 			log.debug("con: successfully setup driver string")
+			_driver_bound = True
 
 		except IOError as e:
 			raise ConnectionError("Error setting up driver: " + str(e))
 		
-		# Pause to give the OS time to generate the device file
-		time.sleep(0.1)
+		# Give the OS time to generate the device file. Stop waiting as soon as it shows up
+		deadline: float = time.monotonic() + _DEVICE_FILE_WAIT
+		while time.monotonic() < deadline:
+			if any(glob.glob(pattern) for pattern in _SCANNER_DEVICE_PATTERNS):
+				break
+			time.sleep(0.005)
 
 
 class SimulatedScannerConnection(ScannerConnection):
@@ -280,11 +808,13 @@ class SimulatedScannerConnection(ScannerConnection):
 	For debugging purposes.
 	"""
 
-	connected: bool = False
-	__log_file = None # file
+	__slots__ = ("__log_file",)
 
 
 	def __init__(self, log_file_path: str = None):
+		super().__init__()
+		self.__log_file = None # file
+
 		if log_file_path:
 			self.connect(log_file_path)
 
@@ -304,7 +834,8 @@ class SimulatedScannerConnection(ScannerConnection):
 
 		# Try to open file in write mode
 		try:
-			self.__log_file = open(port, "w")
+			# Block buffered, a full read logs hundreds of short commands
+			self.__log_file = open(port, "w", buffering=65536)
 		except IOError as e:
 			raise ConnectionError("Could not connect to simulated port -", str(e))
 
@@ -324,7 +855,7 @@ class SimulatedScannerConnection(ScannerConnection):
 		pass
 
 
-	def _exec(self, command: str) -> str:
+	def _exec(self, command: str) -> bytes:
 		"""INTERNAL USE! USE exec() INSTEAD! -- Execute a command
 
 		Args:
@@ -334,21 +865,22 @@ class SimulatedScannerConnection(ScannerConnection):
 			ConnectionError: if the command fails to send
 
 		Returns:
-			str: inputted command
+			bytes: inputted command
 		"""
 
 		# First, try to send command to device
 		try:
 			self.__log_file.write(command + "\n")
-			log.debug("con_exec: send:", command)
+			if log._DEBUG:
+				log.debug("con_exec: send:", command)
 		except IOError as e:
 			raise ConnectionError("Could not communicate (write) with scanner: " + str(e))
 
 		# Simulated connection; return input
-		return command
+		return command.encode("ascii")
 
 
-	def exec(self, command, echo: bool = False, return_tuple: bool = True, allow_error = False):
+	def exec(self, command, echo: bool = False, return_tuple: bool = True, allow_error = False, cacheable: bool = False):
 		"""Execute a command on the scanner. Get response.
 
 		Args:
@@ -356,6 +888,7 @@ class SimulatedScannerConnection(ScannerConnection):
 			echo (bool, optional): Should the response include the command name? Defaults to False.
 			return_tuple (bool, optional): Should the response be in tuple form? Defaults to True.
 			allow_error (bool, optional): Should we allow an invalid command? Defaults to False.
+			cacheable (bool, optional): Ignored. Simulated commands are always logged. Defaults to False.
 
 		Raises:
 			ConnectionError: if a connection was never established
@@ -370,13 +903,11 @@ class SimulatedScannerConnection(ScannerConnection):
 			raise ConnectionError("Cannot execute command when scanner isn't connected")
 
 		# Convert tuple command to command string
-		if type(command) is tuple:
-			command = ",".join(map(str, command))
-		elif type(command) is not str:
-			raise TypeError("exec() command must be str or tuple")
+		command = _to_command_str(command)
 
-		# Execute command, store result
-		resp = self._exec(command)
+		# Execute command, store result. One command at a time, like a real connection
+		with self._exec_lock:
+			resp = self._exec(command).decode("ascii")
 
 		# If we want the result as a tuple (default), create tuple
 		if return_tuple:
@@ -409,3 +940,100 @@ class SimulatedScannerConnection(ScannerConnection):
 	def __del__(self):
 		if self.connected:
 			self.close()
+
+
+class DaemonScannerConnection(ScannerConnection):
+	"""A connection to the scanner through a running "bc125py daemon".
+	The daemon keeps its scanner connection open, so connecting through it
+	skips driver setup, port detection and serial port setup.
+	"""
+
+	__slots__ = ("__socket", "__socket_file")
+
+
+	def __init__(self, socket_path: str = None):
+		super().__init__()
+		self.__socket = None # socket.socket
+		self.__socket_file = None # file
+
+		if socket_path:
+			self.connect(socket_path)
+
+
+	def connect(self, port: str) -> None:
+		"""Establish a connection to the daemon
+
+		Args:
+			port (str): The daemon's socket path.
+
+		Raises:
+			ConnectionError: If the connection is already established, or if any errors occur while connecting
+		"""
+
+		if self.connected:
+			raise ConnectionError("Connection already established")
+
+		import socket
+
+		try:
+			self.__socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+			self.__socket.connect(port)
+		except OSError as e:
+			# The socket may not have been created at all
+			if self.__socket is not None:
+				self.__socket.close()
+				self.__socket = None
+			raise ConnectionError("Could not connect to daemon at " + port + ": " + str(e))
+
+		self.__socket_file = self.__socket.makefile("rwb")
+
+		self.connected = True
+		log.debug("con: DAEMON connection successfully established at", port)
+
+
+	def _exec(self, command: str) -> bytes:
+		"""INTERNAL USE! USE exec() INSTEAD! -- Execute a command
+
+		Args:
+			command (str): the command to execute
+
+		Raises:
+			ConnectionError: if the command fails to send
+			ConnectionError: if the response cannot be read
+
+		Returns:
+			bytes: raw device response, without the line ending
+		"""
+
+		# The daemon takes and answers one command per \n terminated line
+		try:
+			if log._DEBUG:
+				log.debug("con_exec: daemon send:", command)
+			self.__socket_file.write(command.encode("ascii") + b"\n")
+			self.__socket_file.flush()
+
+			resp: bytes = self.__socket_file.readline()
+			if log._DEBUG:
+				log.debug("con_exec: daemon resp:", resp)
+		except OSError as e:
+			raise ConnectionError("Could not communicate with daemon: " + str(e))
+
+		if not resp.endswith(b"\n"):
+			raise ConnectionError("Daemon closed the connection")
+
+		return resp[:-1]
+
+
+	def close(self) -> None:
+		"""Disconnect from the daemon. The daemon's scanner connection stays open.
+
+		Raises:
+			ConnectionError: if the daemon never was connected.
+		"""
+
+		if not self.connected:
+			raise ConnectionError("Can't close closed connection")
+		self.__socket_file.close()
+		self.__socket.close()
+		self.connected = False
+		log.debug("con: daemon connection closed")
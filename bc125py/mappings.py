@@ -1,7 +1,7 @@
 """More complex mappings for human readable values to scanner data"""
 
 
-import re
+import string
 
 
 # region CTCSS/DCS
@@ -179,6 +179,25 @@ DCS: dict[int, str] = {
 VALID_CTCSS_DCS_VALUES: dict[int, str] = {**SPECIAL_CTCSS_DCS_VALUES, **CTCSS, **DCS}
 
 
+class _KeepTable(dict):
+	"""internal use. str.translate() table which keeps the characters it was created with,
+	and deletes every other character. Deleted characters are remembered, so later lookups stay in C
+	"""
+
+	def __missing__(self, key: int) -> None:
+		self[key] = None
+		return None
+
+
+# Characters kept when matching a user provided value, everything else is ignored. See ctcss_dcs_to_internal()
+_MINIMIZE_TABLE = _KeepTable({ord(c): ord(c) for c in string.ascii_lowercase + string.digits})
+
+# The reverse of VALID_CTCSS_DCS_VALUES, keyed by minimized human-friendly value
+_INTERNAL_BY_MINIMIZED_VALUE: dict[str, int] = {
+	value.translate(_MINIMIZE_TABLE): key for key, value in VALID_CTCSS_DCS_VALUES.items()
+}
+
+
 def ctcss_dcs_to_human(code: int) -> str:
 	"""Lookup CTCSS/DCS code and return a human-friendly value.
 
@@ -213,17 +232,13 @@ def ctcss_dcs_to_internal(provided: str) -> int:
 		ValueError: If the provided value is not valid.
 	"""
 
-	minimize_regex = r"[^0-9a-z]"
-
 	provided = str(provided).lower()
-	provided = re.sub(minimize_regex, "", provided)
+	provided = provided.translate(_MINIMIZE_TABLE)
 
-	for key, value in VALID_CTCSS_DCS_VALUES.items():
-		value = re.sub(minimize_regex, "", value)
-		if value == provided:
-			return key
-
-	raise ValueError("Invalid input value: " + str(provided))
+	try:
+		return _INTERNAL_BY_MINIMIZED_VALUE[provided]
+	except KeyError as exc:
+		raise ValueError("Invalid input value: " + str(provided)) from exc
 
 
 # endregion
\ No newline at end of file
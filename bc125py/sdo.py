@@ -169,6 +169,34 @@ class E_CloseCallMode(Enum):
 	do_not_disturb = "2"
 
 
+# Each enum's members by value. A dict lookup is much cheaper than calling the enum
+_ENUM_MEMBERS_BY_VALUE: dict = {
+	enum_type: {member.value: member for member in enum_type}
+	for enum_type in (E_TrueFalse, E_LockState, E_BacklightMode, E_BeepLevel, E_Modulation, E_PriorityMode, E_CloseCallMode)
+}
+
+
+def _enum_from_value(enum_type, value: str) -> Enum:
+	"""internal use. Get an enum member from its value, same as enum_type(value).
+	Used for every field of every command response
+
+	Args:
+		enum_type (type): The enum, one of the E_* enums above
+		value (str): The member's value
+
+	Raises:
+		ValueError: if value is not a value of enum_type
+
+	Returns:
+		Enum: The enum member
+	"""
+
+	try:
+		return _ENUM_MEMBERS_BY_VALUE[enum_type][value]
+	except KeyError:
+		raise ValueError(repr(value) + " is not a valid " + enum_type.__name__) from None
+
+
 #endregion
 
 
@@ -207,11 +235,14 @@ class BankListManager:
 
 
 	def to_write_command(self) -> str:
-		return "".join(map(lambda n: self.__chr_bnk_enabled if n else self.__chr_bnk_disabled, self.banks))
+		enabled: str = self.__chr_bnk_enabled
+		disabled: str = self.__chr_bnk_disabled
+		return "".join([enabled if n else disabled for n in self.banks])
 
 
 	def from_command_response(self, command_response: str) -> None:
-		self.banks = list(map(lambda n: n == self.__chr_bnk_enabled, list(command_response)))
+		enabled: str = self.__chr_bnk_enabled
+		self.banks = [c == enabled for c in command_response]
 
 
 	def to_dict(self) -> list:
@@ -244,6 +275,15 @@ class _ScannerDataObject:
 	"""An object to represent a data object on the scanner, eg: channel, volume, backlight, etc...
 	"""
 
+	# Subclasses list their attributes in __slots__ and set defaults in __init__, no per-instance __dict__
+	__slots__ = ()
+
+	# Can this object's value never change? If so, fetching it may be answered from cache
+	_read_only: bool = False
+
+	# The command to fetch this object, if it never changes. Write commands start with it too
+	_FETCH_COMMAND: tuple = ()
+
 	def __init__(self) -> None:
 		"""Data object constructor
 
@@ -251,7 +291,7 @@ class _ScannerDataObject:
 			NotImplementedError: if sdo._ScannerDataObject is instantiated directly
 		"""
 
-		if type(self) == _ScannerDataObject:
+		if type(self) is _ScannerDataObject:
 			raise NotImplementedError(type(self).__name__ + " cannot be instantiated directly (abstract)")
 
 
@@ -341,7 +381,7 @@ class _ScannerDataObject:
 		"""
 
 		self.from_command_response(
-			scanner_con.exec(self.to_fetch_command())
+			scanner_con.exec(self.to_fetch_command(), cacheable=self._read_only)
 		)
 
 
@@ -353,7 +393,8 @@ class _ScannerDataObject:
 		try:
 			return str(self.to_dict())
 		except NotImplementedError:
-			return ",".join(self.to_write_command())
+			# Write commands may contain numbers
+			return ",".join([str(c) for c in self.to_write_command()])
 
 
 # Example SDO to copy & paste
@@ -367,16 +408,24 @@ class _E(_ScannerDataObject):
 		List all
 	"""
 
-	# Defaults
-	attrib = 0
+	__slots__ = ("attrib",)
+
+	_FETCH_COMMAND: tuple = ("EXX",)
+
+	attrib: int
+
+
+	def __init__(self) -> None:
+		# Defaults
+		self.attrib = 0
 
 
 	def to_write_command(self) -> tuple:
-		return self.to_fetch_command() + (self.attrib,)
+		return self._FETCH_COMMAND + (self.attrib,)
 
 
 	def to_fetch_command(self) -> tuple:
-		return ("EXX",)
+		return self._FETCH_COMMAND
 
 
 	def from_command_response(self, command_response: tuple) -> None:
@@ -405,6 +454,8 @@ class EnterProgramMode(_ScannerDataObject):
 		No attributes. Write command only.
 	"""
 
+	__slots__ = ()
+
 	def to_write_command(self) -> tuple:
 		return ("PRG",)
 
@@ -420,6 +471,8 @@ class ExitProgramMode(_ScannerDataObject):
 		No attributes. Write command only.
 	"""
 
+	__slots__ = ()
+
 	def to_write_command(self) -> tuple:
 		return ("EPG",)
 
@@ -435,11 +488,21 @@ class DeviceModel(_ScannerDataObject):
 		Read only
 	"""
 
-	# Defaults
-	model: str = "NO MDL"
+	__slots__ = ("model",)
+
+	_read_only = True
+
+	_FETCH_COMMAND: tuple = ("MDL",)
+
+	model: str
+
+	def __init__(self) -> None:
+		# Defaults
+		self.model = "NO MDL"
+
 
 	def to_fetch_command(self) -> tuple:
-		return ("MDL",)
+		return self._FETCH_COMMAND
 
 
 	def from_command_response(self, command_response: tuple) -> None:
@@ -465,11 +528,21 @@ class FirmwareVersion(_ScannerDataObject):
 		Read only
 	"""
 
-	# Defaults
-	version: str = "NO VER"
+	__slots__ = ("version",)
+
+	_read_only = True
+
+	_FETCH_COMMAND: tuple = ("VER",)
+
+	version: str
+
+	def __init__(self) -> None:
+		# Defaults
+		self.version = "NO VER"
+
 
 	def to_fetch_command(self) -> tuple:
-		return ("VER",)
+		return self._FETCH_COMMAND
 
 
 	def from_command_response(self, command_response: tuple) -> None:
@@ -495,19 +568,27 @@ class Backlight(_ScannerDataObject):
 		Backlight value expects specific code
 	"""
 
-	# Defaults
-	backlight: E_BacklightMode = E_BacklightMode.always_off
+	__slots__ = ("backlight",)
+
+	_FETCH_COMMAND: tuple = ("BLT",)
+
+	backlight: E_BacklightMode
+
+	def __init__(self) -> None:
+		# Defaults
+		self.backlight = E_BacklightMode.always_off
+
 
 	def to_write_command(self) -> tuple:
-		return self.to_fetch_command() + (self.backlight.value,)
+		return self._FETCH_COMMAND + (self.backlight.value,)
 
 
 	def to_fetch_command(self) -> tuple:
-		return ("BLT",)
+		return self._FETCH_COMMAND
 
 
 	def from_command_response(self, command_response: tuple) -> None:
-		self.backlight = E_BacklightMode(command_response[0])
+		self.backlight = _enum_from_value(E_BacklightMode, command_response[0])
 
 
 	def to_dict(self) -> dict:
@@ -542,15 +623,23 @@ class BatteryChargeTimer(_ScannerDataObject):
 			2700 mAh - 16
 	"""
 
-	# Defaults
-	hours: int = 9
+	__slots__ = ("hours",)
+
+	_FETCH_COMMAND: tuple = ("BSV",)
+
+	hours: int
+
+	def __init__(self) -> None:
+		# Defaults
+		self.hours = 9
+
 
 	def to_write_command(self) -> tuple:
-		return self.to_fetch_command() + (self.hours,)
+		return self._FETCH_COMMAND + (self.hours,)
 
 
 	def to_fetch_command(self) -> tuple:
-		return ("BSV",)
+		return self._FETCH_COMMAND
 
 
 	def from_command_response(self, command_response: tuple) -> None:
@@ -564,7 +653,7 @@ class BatteryChargeTimer(_ScannerDataObject):
 	def from_dict(self, data: dict) -> None:
 		self.hours = data["hours"]
 
-		if not (self.hours >= 1 and self.hours <= 16):
+		if not 1 <= self.hours <= 16:
 			raise InputValidationError("Battery charge time hours must be in range [1-16], given " + str(self.hours))		
 
 
@@ -580,6 +669,8 @@ class ClearScannerMemory(_ScannerDataObject):
 		Takes some time to complete
 	"""
 
+	__slots__ = ()
+
 	def to_write_command(self) -> tuple:
 		return ("CLR",)
 
@@ -593,21 +684,30 @@ class KeypadSettings(_ScannerDataObject):
 		key_lock (E_LockState): Keypad lock status, 0: Unlocked, 1: Locked
 	"""
 
-	# Defaults
-	beep_level: E_BeepLevel = E_BeepLevel.auto
-	key_lock: E_LockState = E_LockState.unlocked
+	__slots__ = ("beep_level", "key_lock")
+
+	_FETCH_COMMAND: tuple = ("KBP",)
+
+	beep_level: E_BeepLevel
+	key_lock: E_LockState
+
+	def __init__(self) -> None:
+		# Defaults
+		self.beep_level = E_BeepLevel.auto
+		self.key_lock = E_LockState.unlocked
+
 
 	def to_write_command(self) -> tuple:
-		return self.to_fetch_command() + (self.beep_level.value, self.key_lock.value)
+		return self._FETCH_COMMAND + (self.beep_level.value, self.key_lock.value)
 
 
 	def to_fetch_command(self) -> tuple:
-		return ("KBP",)
+		return self._FETCH_COMMAND
 
 
 	def from_command_response(self, command_response: tuple) -> None:
-		self.beep_level = E_BeepLevel(command_response[0])
-		self.key_lock = E_LockState(command_response[1])
+		self.beep_level = _enum_from_value(E_BeepLevel, command_response[0])
+		self.key_lock = _enum_from_value(E_LockState, command_response[1])
 
 
 	def to_dict(self) -> dict:
@@ -630,19 +730,27 @@ class PriorityMode(_ScannerDataObject):
 		mode (E_PriorityMode): Mode setting
 	"""
 
-	# Defaults
-	mode: E_PriorityMode = E_PriorityMode.off
+	__slots__ = ("mode",)
+
+	_FETCH_COMMAND: tuple = ("PRI",)
+
+	mode: E_PriorityMode
+
+	def __init__(self) -> None:
+		# Defaults
+		self.mode = E_PriorityMode.off
+
 
 	def to_write_command(self) -> tuple:
-		return self.to_fetch_command() + (self.mode.value,)
+		return self._FETCH_COMMAND + (self.mode.value,)
 
 
 	def to_fetch_command(self) -> tuple:
-		return ("PRI",)
+		return self._FETCH_COMMAND
 
 
 	def from_command_response(self, command_response: tuple) -> None:
-		self.mode = E_PriorityMode(command_response[0])
+		self.mode = _enum_from_value(E_PriorityMode, command_response[0])
 
 
 	def to_dict(self) -> dict:
@@ -665,20 +773,27 @@ class EnabledChannelBanks(_ScannerDataObject):
 		At least one bank must be enabled
 	"""
 
-	# Defaults
-	bank_list_manager: BankListManager = BankListManager(size=10)
+	__slots__ = ("bank_list_manager",)
 
-	def to_write_command(self) -> tuple:
+	_FETCH_COMMAND: tuple = ("SCG",)
 
-		return self.to_fetch_command() + (self.bank_list_manager.to_write_command(),)
+	bank_list_manager: BankListManager
+
+	def __init__(self) -> None:
+		# Each object needs its own banks
+		self.bank_list_manager = BankListManager(size=10)
+
+
+	def to_write_command(self) -> tuple:
+		return self._FETCH_COMMAND + (self.bank_list_manager.to_write_command(),)
 
 
 	def to_fetch_command(self) -> tuple:
-		return ("SCG",)
+		return self._FETCH_COMMAND
 
 
 	def from_command_response(self, command_response: tuple) -> None:
-		self.banks = self.bank_list_manager.from_command_response(command_response[0])
+		self.bank_list_manager.from_command_response(command_response[0])
 
 
 	def to_dict(self) -> dict:
@@ -703,7 +818,9 @@ class DeleteChannel(_ScannerDataObject):
 		index must be in range [1-500]
 	"""
 
-	index: int = 1
+	__slots__ = ("index",)
+
+	index: int
 
 	def __init__(self, index: int = 1) -> None:
 		self.index = index
@@ -732,22 +849,33 @@ class Channel(_ScannerDataObject):
 		name should avoid special characters
 	"""
 
-	index: int = 1
-	name: str = ""
-	frequency: str = "000.0000"
-	modulation: E_Modulation = E_Modulation.auto
-	ctcss: int = 0
-	delay: int = 2
-	locked_out: E_LockState = E_LockState.unlocked
-	priority: E_TrueFalse = E_TrueFalse.false
+	__slots__ = ("index", "name", "frequency", "modulation", "ctcss", "delay", "locked_out", "priority")
+
+	index: int
+	name: str
+	frequency: str
+	modulation: E_Modulation
+	ctcss: int
+	delay: int
+	locked_out: E_LockState
+	priority: E_TrueFalse
 
 
 	def __init__(self, index: int = 1) -> None:
 		self.index = index
+		self.name = ""
+		self.frequency = "000.0000"
+		self.modulation = E_Modulation.auto
+		self.ctcss = 0
+		self.delay = 2
+		self.locked_out = E_LockState.unlocked
+		self.priority = E_TrueFalse.false
 
 
 	def to_write_command(self) -> tuple:
-		return self.to_fetch_command() + (
+		return (
+			"CIN",
+			self.index,
 			self.name if self.name else " ",
 			freq_to_scanner(self.frequency),
 			self.modulation.value,
@@ -766,11 +894,11 @@ class Channel(_ScannerDataObject):
 		self.index = int(command_response[0])
 		self.name = command_response[1]
 		self.frequency = freq_to_mhz(command_response[2])
-		self.modulation = E_Modulation(command_response[3])
+		self.modulation = _enum_from_value(E_Modulation, command_response[3])
 		self.ctcss = int(command_response[4])
 		self.delay = int(command_response[5])
-		self.locked_out = E_LockState(command_response[6])
-		self.priority = E_PriorityMode(command_response[7])
+		self.locked_out = _enum_from_value(E_LockState, command_response[6])
+		self.priority = _enum_from_value(E_PriorityMode, command_response[7])
 
 
 	def to_dict(self) -> dict:
@@ -787,24 +915,65 @@ class Channel(_ScannerDataObject):
 
 
 	def from_dict(self, data) -> None:
-		self.index = data["index"]
-		self.name = data["name"]
-		self.frequency = data["frequency"]
+		self.__set_validated(
+			data["index"],
+			data["name"],
+			data["frequency"],
+			data["modulation"],
+			data["ctcss"],
+			data["delay"],
+			data["locked_out"],
+			data["priority"]
+		)
+
+
+	@classmethod
+	def from_csv_row(cls, row: list) -> "Channel":
+		"""Create a channel from a CSV row, as written by "import --csv". Validates the row
+
+		Args:
+			row (list): index, name, frequency, modulation, ctcss, delay, locked_out, priority
+
+		Raises:
+			InputValidationError: if any data validation error is encountered.
+			ValueError: if the index or delay is not a number
+
+		Returns:
+			Channel: the channel
+		"""
+
+		c = cls()
+		c.__set_validated(int(row[0]), row[1], row[2], row[3], row[4], int(row[5]), row[6], row[7])
+
+		return c
+
+
+	def __set_validated(self, index: int, name: str, frequency: str, modulation: str,
+						ctcss: str, delay: int, locked_out: str, priority: str) -> None:
+		"""internal use. Set all attributes from their dict/CSV representations, then validate them
+
+		Raises:
+			InputValidationError: if any data validation error is encountered.
+		"""
+
+		self.index = index
+		self.name = name
+		self.frequency = frequency
 
 		# Some input flexibility for modulation
-		raw_modulation = data["modulation"].lower()
+		raw_modulation = modulation.lower()
 		raw_modulation = ("nfm" if raw_modulation == "fmn" else raw_modulation)
 		self.modulation = E_Modulation[raw_modulation]
 
 		# We do ctcss later
-		self.delay = data["delay"]
-		self.locked_out = E_LockState[data["locked_out"]]
-		self.priority = E_PriorityMode[data["priority"]]
+		self.delay = delay
+		self.locked_out = E_LockState[locked_out]
+		self.priority = E_PriorityMode[priority]
 
 		err_message: str = "channel: " + str(self.index)
 		err_found: bool = False
 
-		if not (self.index >= 1 and self.index <= 500):
+		if not 1 <= self.index <= 500:
 			err_found = True
 			err_message += ", index must be in range [1-500]"
 
@@ -821,13 +990,13 @@ class Channel(_ScannerDataObject):
 			err_message += ", invalid delay: " + str(self.delay)
 		
 		try:
-			self.ctcss = int(data["ctcss"])
+			self.ctcss = int(ctcss)
 		except ValueError:
 			try:
-				self.ctcss = ctcss_dcs_to_internal(data["ctcss"])
+				self.ctcss = ctcss_dcs_to_internal(ctcss)
 			except ValueError:
 				err_found = True
-				err_message += ", invalid ctcss/dcs: " + str(data["ctcss"]) + " (see --help-tones)"
+				err_message += ", invalid ctcss/dcs: " + str(ctcss) + " (see --help-tones)"
 		
 		if err_found:
 			raise InputValidationError(err_message)
@@ -846,21 +1015,30 @@ class CloseCallDelayCTCSSSettings(_ScannerDataObject):
 		It's not clear why this isn't a part of CLC
 	"""
 
-	# Defaults
-	delay: int = 2
-	ctcss: E_TrueFalse = E_TrueFalse.false
+	__slots__ = ("delay", "ctcss")
+
+	_FETCH_COMMAND: tuple = ("SCO",)
+
+	delay: int
+	ctcss: E_TrueFalse
+
+	def __init__(self) -> None:
+		# Defaults
+		self.delay = 2
+		self.ctcss = E_TrueFalse.false
+
 
 	def to_write_command(self) -> tuple:
-		return self.to_fetch_command() + (self.delay, self.ctcss.value)
+		return self._FETCH_COMMAND + (self.delay, self.ctcss.value)
 
 
 	def to_fetch_command(self) -> tuple:
-		return ("SCO",)
+		return self._FETCH_COMMAND
 
 
 	def from_command_response(self, command_response: tuple) -> None:
 		self.delay = int(command_response[0])
-		self.ctcss = E_TrueFalse(command_response[1])
+		self.ctcss = _enum_from_value(E_TrueFalse, command_response[1])
 
 
 	def to_dict(self) -> dict:
@@ -888,12 +1066,20 @@ class LockedFrequencies(_ScannerDataObject):
 		Most traditional SDO functions not implemented. Use write_to() and read_from().
 	"""
 
-	# Defaults
-	frequencies: list = []
+	__slots__ = ("frequencies",)
+
+	_FETCH_COMMAND: tuple = ("GLF",)
+
+	frequencies: list
+
+
+	def __init__(self) -> None:
+		# Defaults
+		self.frequencies = []
 
 
 	def to_fetch_command(self) -> tuple:
-		return ("GLF",)
+		return self._FETCH_COMMAND
 
 
 	def to_dict(self) -> dict:
@@ -986,6 +1172,8 @@ class UnlockFrequency(_ScannerDataObject):
 		May set frequency via constructor
 	"""
 
+	__slots__ = ("frequency",)
+
 	frequency: str
 
 	def __init__(self, frequency: str = "0") -> None:
@@ -1007,6 +1195,8 @@ class LockFrequency(_ScannerDataObject):
 		May set frequency via constructor
 	"""
 
+	__slots__ = ("frequency",)
+
 	frequency: str
 
 	def __init__(self, frequency: str = "0") -> None:
@@ -1032,16 +1222,30 @@ class CloseCallSettings(_ScannerDataObject):
 		cc_bands length must be 5
 	"""
 
-	# Defaults
-	mode: E_CloseCallMode = E_CloseCallMode.off
-	alert_beep: E_TrueFalse = E_TrueFalse.true
-	alert_light: E_TrueFalse = E_TrueFalse.true
-	cc_bands: BankListManager = BankListManager(size=5, invert=True, require_enabled=False)
-	lockout: E_LockState = E_LockState.unlocked
+	__slots__ = ("mode", "alert_beep", "alert_light", "cc_bands", "lockout")
+
+	_FETCH_COMMAND: tuple = ("CLC",)
+
+	mode: E_CloseCallMode
+	alert_beep: E_TrueFalse
+	alert_light: E_TrueFalse
+	cc_bands: BankListManager
+	lockout: E_LockState
+
+
+	def __init__(self) -> None:
+		# Defaults
+		self.mode = E_CloseCallMode.off
+		self.alert_beep = E_TrueFalse.true
+		self.alert_light = E_TrueFalse.true
+		self.lockout = E_LockState.unlocked
+
+		# Each object needs its own bands
+		self.cc_bands = BankListManager(size=5, invert=True, require_enabled=False)
 
 
 	def to_write_command(self) -> tuple:
-		return self.to_fetch_command() + (
+		return self._FETCH_COMMAND + (
 			self.mode.value,
 			self.alert_beep.value,
 			self.alert_light.value,
@@ -1051,15 +1255,15 @@ class CloseCallSettings(_ScannerDataObject):
 
 
 	def to_fetch_command(self) -> tuple:
-		return ("CLC",)
+		return self._FETCH_COMMAND
 
 
 	def from_command_response(self, command_response: tuple) -> None:
-		self.mode = E_CloseCallMode(command_response[0])
-		self.alert_beep = E_TrueFalse(command_response[1])
-		self.alert_light = E_TrueFalse(command_response[2])
+		self.mode = _enum_from_value(E_CloseCallMode, command_response[0])
+		self.alert_beep = _enum_from_value(E_TrueFalse, command_response[1])
+		self.alert_light = _enum_from_value(E_TrueFalse, command_response[2])
 		self.cc_bands.from_command_response(command_response[3])
-		self.lockout = E_LockState(command_response[4])
+		self.lockout = _enum_from_value(E_LockState, command_response[4])
 
 
 	def to_dict(self) -> dict:
@@ -1093,16 +1297,23 @@ class EnabledServiceSearchBanks(_ScannerDataObject):
 		At least one bank must be enabled
 	"""
 
-	# Defaults
-	bank_list_manager: BankListManager = BankListManager(size=10)
+	__slots__ = ("bank_list_manager",)
+
+	_FETCH_COMMAND: tuple = ("SSG",)
+
+	bank_list_manager: BankListManager
+
+	def __init__(self) -> None:
+		# Each object needs its own banks
+		self.bank_list_manager = BankListManager(size=10)
 
 
 	def to_write_command(self) -> tuple:
-		return self.to_fetch_command() + (self.bank_list_manager.to_write_command(),)
+		return self._FETCH_COMMAND + (self.bank_list_manager.to_write_command(),)
 
 
 	def to_fetch_command(self) -> tuple:
-		return ("SSG",)
+		return self._FETCH_COMMAND
 
 
 	def from_command_response(self, command_response: tuple) -> None:
@@ -1130,16 +1341,23 @@ class EnabledCustomSearchBanks(_ScannerDataObject):
 		At least one bank must be enabled
 	"""
 
-	# Defaults
-	bank_list_manager: BankListManager = BankListManager(size=10)
+	__slots__ = ("bank_list_manager",)
+
+	_FETCH_COMMAND: tuple = ("CSG",)
+
+	bank_list_manager: BankListManager
+
+	def __init__(self) -> None:
+		# Each object needs its own banks
+		self.bank_list_manager = BankListManager(size=10)
 
 
 	def to_write_command(self) -> tuple:
-		return self.to_fetch_command() + (self.bank_list_manager.to_write_command(),)
+		return self._FETCH_COMMAND + (self.bank_list_manager.to_write_command(),)
 
 
 	def to_fetch_command(self) -> tuple:
-		return ("CSG",)
+		return self._FETCH_COMMAND
 
 
 	def from_command_response(self, command_response: tuple) -> None:
@@ -1168,18 +1386,23 @@ class CustomSearchBank(_ScannerDataObject):
 		index MUST be in range [1-10]
 	"""
 
-	# Defaults
-	index: int = 1
-	lower_limit: str = "25.000"
-	upper_limit: str = "512.000"
+	__slots__ = ("index", "lower_limit", "upper_limit")
+
+	index: int
+	lower_limit: str
+	upper_limit: str
 
 
 	def __init__(self, index: int = 1) -> None:
 		self.index = index
+		self.lower_limit = "25.000"
+		self.upper_limit = "512.000"
 
 
 	def to_write_command(self) -> tuple:
-		return self.to_fetch_command() + (
+		return (
+			"CSP",
+			self.index,
 			freq_to_scanner(self.lower_limit),
 			freq_to_scanner(self.upper_limit)
 		)
@@ -1211,7 +1434,7 @@ class CustomSearchBank(_ScannerDataObject):
 		err_found = False
 		err_message = "search bnk: " + str(self.index)
 
-		if not (self.index >= 1 and self.index <= 10):
+		if not 1 <= self.index <= 10:
 			err_found = True
 			err_message += ", index must be in range [1-10]"
 		
@@ -1246,20 +1469,28 @@ class WeatherAlertSettings(_ScannerDataObject):
 		alert_priority (E_TrueFalse): Should the scanner interrupt when WX alert detected. Default false.
 	"""
 
-	# Defaults
-	alert_priority: E_TrueFalse = E_TrueFalse.false
+	__slots__ = ("alert_priority",)
+
+	_FETCH_COMMAND: tuple = ("WXS",)
+
+	alert_priority: E_TrueFalse
+
+
+	def __init__(self) -> None:
+		# Defaults
+		self.alert_priority = E_TrueFalse.false
 
 
 	def to_write_command(self) -> tuple:
-		return self.to_fetch_command() + (self.alert_priority.value,)
+		return self._FETCH_COMMAND + (self.alert_priority.value,)
 
 
 	def to_fetch_command(self) -> tuple:
-		return ("WXS",)
+		return self._FETCH_COMMAND
 
 
 	def from_command_response(self, command_response: tuple) -> None:
-		self.alert_priority = E_TrueFalse(command_response[0])
+		self.alert_priority = _enum_from_value(E_TrueFalse, command_response[0])
 
 
 	def to_dict(self) -> dict:
@@ -1281,16 +1512,24 @@ class DisplayContrast(_ScannerDataObject):
 		contrast range must be in [1-15]
 	"""
 
-	# Defaults
-	contrast: int = 8
+	__slots__ = ("contrast",)
+
+	_FETCH_COMMAND: tuple = ("CNT",)
+
+	contrast: int
+
+
+	def __init__(self) -> None:
+		# Defaults
+		self.contrast = 8
 
 
 	def to_write_command(self) -> tuple:
-		return self.to_fetch_command() + (self.contrast,)
+		return self._FETCH_COMMAND + (self.contrast,)
 
 
 	def to_fetch_command(self) -> tuple:
-		return ("CNT",)
+		return self._FETCH_COMMAND
 
 
 	def from_command_response(self, command_response: tuple) -> None:
@@ -1304,7 +1543,7 @@ class DisplayContrast(_ScannerDataObject):
 	def from_dict(self, data) -> None:
 		self.contrast = data["contrast"]
 
-		if not (self.contrast >= 1 and self.contrast <= 15):
+		if not 1 <= self.contrast <= 15:
 			raise InputValidationError("screen contrast must be in range [1-15]")
 
 
@@ -1321,16 +1560,24 @@ class DeviceVolume(_ScannerDataObject):
 		15 is maximum and quite loud
 	"""
 
-	# Defaults
-	volume: int = 8
+	__slots__ = ("volume",)
+
+	_FETCH_COMMAND: tuple = ("VOL",)
+
+	volume: int
+
+
+	def __init__(self) -> None:
+		# Defaults
+		self.volume = 8
 
 
 	def to_write_command(self) -> tuple:
-		return self.to_fetch_command() + (self.volume,)
+		return self._FETCH_COMMAND + (self.volume,)
 
 
 	def to_fetch_command(self) -> tuple:
-		return ("VOL",)
+		return self._FETCH_COMMAND
 
 
 	def from_command_response(self, command_response: tuple) -> None:
@@ -1344,7 +1591,7 @@ class DeviceVolume(_ScannerDataObject):
 	def from_dict(self, data) -> None:
 		self.volume = data["volume"]
 
-		if not (self.volume >= 0 and self.volume <= 15):
+		if not 0 <= self.volume <= 15:
 			raise InputValidationError("device volume must be in range [0-15]")
 
 
@@ -1362,16 +1609,24 @@ class Squelch(_ScannerDataObject):
 		2 appears to be optimal value, 1 in some situations.
 	"""
 
-	# Defaults
-	squelch: int = 2
+	__slots__ = ("squelch",)
+
+	_FETCH_COMMAND: tuple = ("SQL",)
+
+	squelch: int
+
+
+	def __init__(self) -> None:
+		# Defaults
+		self.squelch = 2
 
 
 	def to_write_command(self) -> tuple:
-		return self.to_fetch_command() + (self.squelch,)
+		return self._FETCH_COMMAND + (self.squelch,)
 
 
 	def to_fetch_command(self) -> tuple:
-		return ("SQL",)
+		return self._FETCH_COMMAND
 
 
 	def from_command_response(self, command_response: tuple) -> None:
@@ -1385,7 +1640,7 @@ class Squelch(_ScannerDataObject):
 	def from_dict(self, data) -> None:
 		self.squelch = data["squelch"]
 
-		if not (self.squelch >= 0 and self.squelch <= 15):
+		if not 0 <= self.squelch <= 15:
 			raise InputValidationError("squelch must be in range [0-15]")
 
 
@@ -1487,8 +1742,7 @@ class Scanner:
 		self.priority_mode.write_to(scanner_con)
 		self.enabled_channel_banks.write_to(scanner_con)
 
-		for c in self.channels:
-			c.write_to(scanner_con)
+		scanner_con.exec_many([c.to_write_command() for c in self.channels])
 		
 		self.cc_ctcss_delay.write_to(scanner_con)
 		self.locked_frequencies.write_to(scanner_con)
@@ -1496,8 +1750,7 @@ class Scanner:
 		self.enabled_service_search_banks.write_to(scanner_con)
 		self.enabled_custom_search_banks.write_to(scanner_con)
 
-		for c in self.custom_search_banks:
-			c.write_to(scanner_con)
+		scanner_con.exec_many([c.to_write_command() for c in self.custom_search_banks])
 		
 		self.weather_alert_settings.write_to(scanner_con)
 		self.display_contrast.write_to(scanner_con)
@@ -1530,8 +1783,9 @@ class Scanner:
 			self.channels.append(Channel(i))
 
 		# Read ALL channels from scanner
-		for c in self.channels:
-			c.read_from(scanner_con)
+		responses: list = scanner_con.exec_many([c.to_fetch_command() for c in self.channels])
+		for c, resp in zip(self.channels, responses):
+			c.from_command_response(resp)
 		
 		self.cc_ctcss_delay.read_from(scanner_con)
 		self.locked_frequencies.read_from(scanner_con)
@@ -1545,8 +1799,9 @@ class Scanner:
 			self.custom_search_banks.append(CustomSearchBank(i))
 
 		# Read ALL CSBs
-		for c in self.custom_search_banks:
-			c.read_from(scanner_con)
+		responses = scanner_con.exec_many([c.to_fetch_command() for c in self.custom_search_banks])
+		for c, resp in zip(self.custom_search_banks, responses):
+			c.from_command_response(resp)
 		
 		self.weather_alert_settings.read_from(scanner_con)
 		self.display_contrast.read_from(scanner_con)
@@ -1573,13 +1828,13 @@ class Scanner:
 			"locked_frequencies": self.locked_frequencies.to_dict(),
 			"enabled_service_search_banks": self.enabled_service_search_banks.to_dict(),
 			"enabled_custom_search_banks": self.enabled_custom_search_banks.to_dict(),
-			"custom_search_banks": list(map(lambda c : c.to_dict(), self.custom_search_banks)),
+			"custom_search_banks": [c.to_dict() for c in self.custom_search_banks],
 			"weather_alert_settings": self.weather_alert_settings.to_dict(),
 			"display_contrast": self.display_contrast.to_dict(),
 			"device_volume": self.device_volume.to_dict(),
 			"squelch": self.squelch.to_dict(),
 
-			"channels": list(map(lambda c : c.to_dict(), self.channels))
+			"channels": [c.to_dict() for c in self.channels]
 		}
 
 
@@ -0,0 +1,38 @@
+"""Tests for CLI subcommands, against a fake scanner connection"""
+
+from bc125py import con
+from bc125py.app import cli
+
+
+class FailingConnection:
+	"""A scanner connection whose batches fail with a ConnectionError, and whose EPG fails with a CommandError
+	"""
+
+	def exec(self, command, **kwargs):
+		if con._to_command_str(command) == "EPG":
+			raise con.CommandError("Error in command: EPG")
+		return ("OK",)
+
+	def exec_many(self, commands: list, **kwargs):
+		raise ConnectionError("Timed out waiting for scanner response")
+
+	def close(self) -> None:
+		pass
+
+
+# --- test export_write() reports the write error when EPG fails too
+def test_export_write_csv_epg_fails(tmp_path, monkeypatch, capsys):
+	in_file = tmp_path / "channels.csv"
+	in_file.write_text(
+		"Index,Name,Frequency (MHz),Modulation,CTCSS,Delay (sec),Lockout,Priority\n"
+		"1, ,000.0000,auto,none,2,unlocked,off\n"
+	)
+
+	monkeypatch.setattr(cli, "enforce_root", lambda: None)
+	monkeypatch.setattr(cli, "get_scanner_connection", lambda *args, **kwargs: FailingConnection())
+
+	assert cli.export_write(str(in_file), csv=True) == 1
+
+	err: str = capsys.readouterr().err
+	assert "Could not exit program mode: Error in command: EPG" in err
+	assert err.rstrip().endswith("Timed out waiting for scanner response")
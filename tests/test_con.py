@@ -0,0 +1,140 @@
+"""Tests for ScannerConnection, against a simulated scanner"""
+
+import pytest
+from bc125py import con
+from bc125py.con import *
+
+
+class FakeSerial:
+	"""Stands in for serial.Serial. Answers every command with "<name>,OK", or "<name>,ERR" for
+	command names in errors
+
+	Args:
+		late (int, optional): How many reads time out before the scanner answers. Defaults to 0.
+		answer (bool, optional): Does the scanner answer at all? Defaults to True.
+		errors (tuple, optional): Command names that fail. Defaults to ().
+	"""
+
+	def __init__(self, late: int = 0, answer: bool = True, errors: tuple = ()):
+		self.late: int = late
+		self.answer: bool = answer
+		self.errors: tuple = errors
+		self.timeout: float = con._READ_TIMEOUT
+		self.written: list = []
+		self.__pending = bytearray()
+
+	@property
+	def in_waiting(self) -> int:
+		if self.late:
+			return 0
+		return len(self.__pending)
+
+	def write(self, data: bytes) -> None:
+		for command in data.decode("ascii").split("\r")[:-1]:
+			self.written.append(command)
+
+			name: str = command.split(",", 1)[0]
+			status: str = "ERR" if name in self.errors else "OK"
+			self.__pending += (name + "," + status + "\r").encode("ascii")
+
+	def read(self, size: int = 1) -> bytes:
+		# Simulate a read timeout
+		if self.late or not self.answer:
+			self.late = max(self.late - 1, 0)
+			return b""
+
+		data: bytes = bytes(self.__pending[:size])
+		del self.__pending[:size]
+		return data
+
+	def flush(self) -> None:
+		pass
+
+	def reset_input_buffer(self) -> None:
+		self.__pending.clear()
+
+	def reset_output_buffer(self) -> None:
+		pass
+
+	def close(self) -> None:
+		pass
+
+
+def make_connection(port: FakeSerial, pipelining: bool = True) -> ScannerConnection:
+	con._import_serial()
+
+	scanner_con = ScannerConnection(pipelining=pipelining)
+	scanner_con._ScannerConnection__serial = port
+	scanner_con._ScannerConnection__rx_buffer = bytearray()
+	scanner_con.connected = True
+
+	return scanner_con
+
+
+# region exec_many()
+
+# --- test exec_many() with pipelining
+def test_exec_many_pipelined():
+	port = FakeSerial()
+	scanner_con = make_connection(port)
+
+	assert scanner_con.exec_many(["MDL", "VER", "BLT"], window=2) == [("OK",), ("OK",), ("OK",)]
+	assert port.written == ["MDL", "VER", "BLT"]
+	assert scanner_con.pipelining
+	assert port.timeout == con._READ_TIMEOUT
+
+
+# --- test exec_many() when the scanner answers a window late
+def test_exec_many_late_answer():
+	port = FakeSerial(late=1)
+	scanner_con = make_connection(port)
+
+	commands = ["MDL", "VER", "BLT", "BSV"]
+	assert scanner_con.exec_many(commands, echo=True, window=2) == [(c, "OK") for c in commands]
+
+	# Nothing sent twice, the rest sent one by one
+	assert port.written == commands
+	assert not scanner_con.pipelining
+	assert port.timeout == con._READ_TIMEOUT
+
+
+# --- test exec_many() when the scanner never answers
+def test_exec_many_no_answer():
+	port = FakeSerial(answer=False)
+	scanner_con = make_connection(port)
+
+	with pytest.raises(ConnectionError):
+		scanner_con.exec_many(["MDL", "VER", "BLT"], window=2)
+
+	# Only the first window went out
+	assert port.written == ["MDL", "VER"]
+	assert port.timeout == con._READ_TIMEOUT
+
+
+# --- test exec_many() stops after a window with an error
+def test_exec_many_error_stops_batch():
+	port = FakeSerial(errors=("VER",))
+	scanner_con = make_connection(port)
+
+	with pytest.raises(CommandError):
+		scanner_con.exec_many(["MDL", "VER", "BLT", "BSV"], window=2)
+
+	# The second window never went out
+	assert port.written == ["MDL", "VER"]
+	assert port.timeout == con._READ_TIMEOUT
+
+
+# --- test pipelined exec_many() drops cached responses
+def test_exec_many_invalidates_cache():
+	port = FakeSerial()
+	scanner_con = make_connection(port)
+
+	scanner_con.exec("MDL", cacheable=True)
+	scanner_con.exec("MDL", cacheable=True)
+	assert port.written == ["MDL"]
+
+	scanner_con.exec_many(["PRG", "CLR", "EPG"])
+	scanner_con.exec("MDL", cacheable=True)
+	assert port.written == ["MDL", "PRG", "CLR", "EPG", "MDL"]
+
+# endregion
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 
 import pytest
 
-from bc125py.mappings import ctcss_dcs_to_human, ctcss_dcs_to_internal
+from bc125py.mappings import VALID_CTCSS_DCS_VALUES, ctcss_dcs_to_human, ctcss_dcs_to_internal
 
 
 @dataclass
@@ -35,6 +35,11 @@ def test_ctcss_dcs_to_internal(data: DataStruct):
     """
     assert ctcss_dcs_to_internal(data.human) == data.internal
 
+def test_ctcss_dcs_to_internal_round_trip():
+    """Ensure every human-friendly value maps back to its internal value."""
+    for internal, human in VALID_CTCSS_DCS_VALUES.items():
+        assert ctcss_dcs_to_internal(human) == internal
+
 INVALIDH2IDATA = (DataStruct(human="12345"),
                   DataStruct(human=12345),
                   DataStruct(human="123.45"),
@@ -164,6 +164,23 @@ def test_BatteryChargeTimer(battery_charge_validity_pair: tuple):
 del BATTERY_CHARGE_VALIDITY
 
 
+# SCG Set active scanner banks
+def test_EnabledChannelBanks():
+	a = EnabledChannelBanks()
+	a.from_command_response(("0101010101",))
+
+	assert a.to_dict() == {"banks": [True, False] * 5}
+	assert a.to_write_command() == ("SCG", "0101010101")
+
+	# Banks aren't shared between objects
+	assert EnabledChannelBanks().to_dict() == {"banks": [True] * 10}
+
+
+# DCH Delete Channel
+def test_DeleteChannel():
+	assert str(DeleteChannel(5)) == "DCH,5"
+
+
 # CIN Channel
 def _get_base_channel(data: dict = {}):
 	base = dict({
@@ -213,6 +230,41 @@ def test_BatteryChargeTimer(cin_validity_pair: tuple):
 		with pytest.raises(InputValidationError):
 			Channel().from_dict(d)
 
+def test_Channel_from_csv_row():
+	row = ["2", "AAR EOTD", "457.9375", "FMN", "none", "2", "unlocked", "off"]
+	c = Channel.from_csv_row(row)
+
+	assert c.index == 2
+	assert c.modulation == E_Modulation.nfm
+	assert c.delay == 2
+
+	d = Channel()
+	d.from_dict({
+		"index": 2,
+		"name": "AAR EOTD",
+		"frequency": "457.9375",
+		"modulation": "nfm",
+		"ctcss": "none",
+		"delay": 2,
+		"locked_out": "unlocked",
+		"priority": "off"
+	})
+	assert c.to_write_command() == d.to_write_command()
+
+	with pytest.raises(InputValidationError):
+		Channel.from_csv_row(["0"] + row[1:])
+
+def test_Channel_from_command_response():
+	c = Channel()
+	c.from_command_response(("2", "AAR EOTD", "04579375", "NFM", "0", "2", "1", "0"))
+
+	assert c.modulation == E_Modulation.nfm
+	assert c.locked_out == E_LockState.locked
+	assert c.priority == E_PriorityMode.off
+
+	with pytest.raises(ValueError):
+		c.from_command_response(("2", "AAR EOTD", "04579375", "XFM", "0", "2", "1", "0"))
+
 del CHANNEL_VALIDITY
 del _get_base_channel
 